@@ -0,0 +1,148 @@
+import heapq
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from algorithms.connectivity_algos import index_digraph
+
+
+def index_weighted(graph):
+    """
+    Integer adjacency plus parallel weight lists
+
+    Returns:
+        tuple: (nodes, adjacency, weights) where weights is None when the
+            neighbors are plain lists (unweighted graph)
+    """
+    nodes, index, adjacency = index_digraph(graph)
+    if not any(isinstance(neighbors, dict) for neighbors in graph.values()):
+        return nodes, adjacency, None
+    weights = [[] for _ in nodes]
+    for u, neighbors in graph.items():
+        if isinstance(neighbors, dict):
+            weights[index[u]] = list(neighbors.values())
+        else:
+            weights[index[u]] = [1] * len(neighbors)
+    return nodes, adjacency, weights
+
+
+def single_source_dependencies(adjacency, weights, s, centrality):
+    """Add the Brandes dependencies of source s to centrality (a list)"""
+    n = len(adjacency)
+    sigma = [0] * n
+    sigma[s] = 1
+    predecessors = [[] for _ in range(n)]
+    order = []
+
+    if weights is None:
+        # BFS counts the shortest paths level by level
+        dist = [-1] * n
+        dist[s] = 0
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            for w in adjacency[v]:
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    queue.append(w)
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+    else:
+        # Dijkstra settles the vertices in order of distance
+        dist = [float('inf')] * n
+        dist[s] = 0
+        settled = [False] * n
+        priority_queue = [(0, s)]
+        while priority_queue:
+            d, v = heapq.heappop(priority_queue)
+            if settled[v]:
+                continue
+            settled[v] = True
+            order.append(v)
+            for w, weight in zip(adjacency[v], weights[v]):
+                distance = d + weight
+                if distance < dist[w]:
+                    dist[w] = distance
+                    sigma[w] = sigma[v]
+                    predecessors[w] = [v]
+                    heapq.heappush(priority_queue, (distance, w))
+                elif distance == dist[w] and not settled[w]:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+
+    # Accumulate dependencies from the farthest vertices back to the source
+    delta = [0.0] * n
+    for w in reversed(order):
+        coefficient = (1 + delta[w]) / sigma[w]
+        for v in predecessors[w]:
+            delta[v] += sigma[v] * coefficient
+        if w != s:
+            centrality[w] += delta[w]
+
+
+worker_adjacency = None
+worker_weights = None
+
+
+def init_worker(adjacency, weights):
+    """Keep the graph in each worker process for the whole run"""
+    global worker_adjacency, worker_weights
+    worker_adjacency = adjacency
+    worker_weights = weights
+
+
+def dependencies_for_sources(sources):
+    """Summed dependencies of a batch of sources, computed in a worker"""
+    centrality = [0.0] * len(worker_adjacency)
+    for s in sources:
+        single_source_dependencies(worker_adjacency, worker_weights, s, centrality)
+    return np.array(centrality)
+
+
+def betweenness_centrality(graph, k=None, workers=None, undirected=False, seed=None):
+    """
+    Brandes betweenness centrality
+
+    Unweighted graphs ({node: [neighbors]}) use BFS from each source and
+    weighted graphs ({node: {neighbor: weight}}) use heap Dijkstra.
+
+    Args:
+        graph: Directed graph as a dict, like the inputs of bfs() or dijkstra()
+        k: Number of sampled pivot sources for the approximate mode. The
+            result is scaled by n / k. None runs every source (exact)
+        workers: Number of processes sharing the sources. None or 1 stays
+            in this process
+        undirected: Halve the scores, for graphs listing every edge both ways
+        seed: Seed for the pivot sample
+
+    Returns:
+        dict: {node: betweenness}
+    """
+    nodes, adjacency, weights = index_weighted(graph)
+    n = len(nodes)
+    if k is None or k >= n:
+        sources = list(range(n))
+    else:
+        sources = random.Random(seed).sample(range(n), k)
+
+    if workers is None or workers <= 1:
+        centrality = [0.0] * n
+        for s in sources:
+            single_source_dependencies(adjacency, weights, s, centrality)
+        centrality = np.array(centrality)
+    else:
+        batches = [sources[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(adjacency, weights)) as pool:
+            partials = list(pool.map(dependencies_for_sources, batches))
+        centrality = np.sum(partials, axis=0) if partials else np.zeros(n)
+
+    if sources and len(sources) < n:
+        centrality *= n / len(sources)
+    if undirected:
+        centrality /= 2
+    return dict(zip(nodes, centrality.tolist()))
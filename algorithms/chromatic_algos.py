@@ -0,0 +1,130 @@
+import time
+
+from algorithms.clique_algos import bitset_adjacency, clique_search
+from algorithms.coloring_algos import dsatur_colors, index_graph
+from algorithms.graph_algos import welsh_powell
+
+# Refuted partial colorings kept before the memo is reset
+MAX_REFUTED_STATES = 50000
+
+
+def exact_coloring(graph, time_limit=10.0):
+    """
+    Exact chromatic number by DSatur branch and bound
+
+    The upper bound starts from the better of welsh_powell() and DSatur, the
+    lower bound from a maximum clique, whose vertices are pre-colored to break
+    the color symmetry. The search always branches on the uncolored vertex of
+    highest saturation, opens at most one new color per branch, and skips
+    partial colorings that are the same partition as one already refuted.
+
+    Args:
+        graph: Graph as {node: [neighbors]}, like welsh_powell's input
+        time_limit: Wall-clock budget in seconds
+
+    Returns:
+        dict: Solution containing:
+            - 'coloring': best {node: color} found, colors starting at 1
+            - 'num_colors': number of colors it uses
+            - 'lower_bound': best proven lower bound
+            - 'status': 'optimal' or 'time_limit'
+            - 'nodes_explored': number of search nodes
+    """
+    deadline = time.perf_counter() + time_limit
+    nodes, adjacency = index_graph(graph)
+    n = len(nodes)
+    if n == 0:
+        return {'coloring': {}, 'num_colors': 0, 'lower_bound': 0,
+                'status': 'optimal', 'nodes_explored': 0}
+
+    # Upper bound from the heuristics
+    _, best = dsatur_colors(adjacency)
+    best = [c - 1 for c in best]
+    initial = welsh_powell({nodes[v]: [nodes[u] for u in adjacency[v]] for v in range(n)})
+    if max(initial.values()) < max(best) + 1:
+        best = [initial[node] - 1 for node in nodes]
+    best_k = max(best) + 1
+
+    # Lower bound from a clique, using part of the budget
+    clique, _ = clique_search(bitset_adjacency(adjacency), time.perf_counter() + time_limit / 4)
+    lower = max(len(clique), 1)
+
+    colors = [-1] * n
+    count = [[0] * best_k for _ in range(n)]
+    saturation = [0] * n
+    degree = [len(neighbors) for neighbors in adjacency]
+
+    def assign(v, c):
+        colors[v] = c
+        for u in adjacency[v]:
+            if count[u][c] == 0:
+                saturation[u] += 1
+            count[u][c] += 1
+
+    def unassign(v, c):
+        colors[v] = -1
+        for u in adjacency[v]:
+            count[u][c] -= 1
+            if count[u][c] == 0:
+                saturation[u] -= 1
+
+    def partition_key():
+        """Colors relabeled by first appearance, equal for symmetric states"""
+        relabel = {}
+        return tuple(relabel.setdefault(c, len(relabel)) if c >= 0 else -1 for c in colors)
+
+    for c, v in enumerate(clique):
+        assign(v, c)
+
+    refuted = set()
+    explored = 0
+    timed_out = False
+
+    def search(colored, used):
+        nonlocal best, best_k, explored, timed_out
+        if colored == n:
+            best = colors[:]
+            best_k = used
+            return
+        if time.perf_counter() > deadline:
+            timed_out = True
+            return
+        key = partition_key()
+        if key in refuted:
+            return
+        explored += 1
+        bound_before = best_k
+
+        # DSatur choice: highest saturation, then highest degree
+        v = -1
+        for u in range(n):
+            if colors[u] < 0 and (v < 0 or (saturation[u], degree[u]) > (saturation[v], degree[v])):
+                v = u
+
+        for c in range(min(used + 1, best_k - 1)):
+            if count[v][c]:
+                continue
+            assign(v, c)
+            search(colored + 1, max(used, c + 1))
+            unassign(v, c)
+            if timed_out or best_k == lower:
+                return
+
+        # Nothing better below this state, whatever the order it is reached in
+        if best_k == bound_before:
+            if len(refuted) >= MAX_REFUTED_STATES:
+                refuted.clear()
+            refuted.add(key)
+
+    if best_k > lower:
+        search(len(clique), len(clique))
+
+    if not timed_out:
+        lower = best_k
+    return {
+        'coloring': {node: best[v] + 1 for v, node in enumerate(nodes)},
+        'num_colors': best_k,
+        'lower_bound': lower,
+        'status': 'time_limit' if timed_out else 'optimal',
+        'nodes_explored': explored,
+    }
@@ -0,0 +1,102 @@
+import time
+
+from algorithms.coloring_algos import index_graph
+
+
+def bitset_adjacency(adjacency):
+    """Neighbors of each vertex as a Python int with one bit per vertex"""
+    bits = []
+    for neighbors in adjacency:
+        row = 0
+        for u in neighbors:
+            row |= 1 << u
+        bits.append(row)
+    return bits
+
+
+def color_bound(candidates, bits):
+    """Number of color classes of a greedy coloring of the candidate set"""
+    classes = 0
+    uncolored = candidates
+    while uncolored:
+        classes += 1
+        available = uncolored
+        while available:
+            lowest = available & -available
+            v = lowest.bit_length() - 1
+            uncolored &= ~lowest
+            # Neighbors of v cannot share its color
+            available &= ~lowest & ~bits[v]
+    return classes
+
+
+def clique_search(bits, deadline=None):
+    """
+    Branch and bound over bitsets for a maximum clique
+
+    Bron-Kerbosch branching with a Tomita pivot (the candidate with the most
+    candidate neighbors), pruned whenever the clique built so far plus a
+    greedy coloring bound of the candidates cannot beat the best clique.
+
+    Returns:
+        tuple: (clique, complete) with the vertex indices of the largest
+            clique found and whether the search finished before the deadline
+    """
+    best = []
+    timed_out = False
+
+    def expand(clique, candidates):
+        nonlocal best, timed_out
+        if not candidates:
+            if len(clique) > len(best):
+                best = clique[:]
+            return
+        if deadline is not None and time.perf_counter() > deadline:
+            timed_out = True
+            return
+        if len(clique) + color_bound(candidates, bits) <= len(best):
+            return
+
+        # Pivot on the candidate with the most neighbors among the candidates
+        pivot = max(iter_bits(candidates), key=lambda u: (candidates & bits[u]).bit_count())
+        for v in iter_bits(candidates & ~bits[pivot]):
+            clique.append(v)
+            expand(clique, candidates & bits[v])
+            clique.pop()
+            candidates &= ~(1 << v)
+            if timed_out:
+                return
+            if len(clique) + candidates.bit_count() <= len(best):
+                return
+
+    expand([], (1 << len(bits)) - 1)
+    return best, not timed_out
+
+
+def iter_bits(bitset):
+    """Indices of the set bits, lowest first"""
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+def maximum_clique(graph, time_limit=None):
+    """
+    Maximum clique of a {node: [neighbors]} graph
+
+    Any clique is a lower bound on the chromatic number, so the result can
+    be compared with the number of colors a coloring uses.
+
+    Args:
+        graph: Graph as {node: [neighbors]}, like coloration_glouton's input
+        time_limit: Optional budget in seconds. When it runs out the largest
+            clique found so far is returned
+
+    Returns:
+        list: Nodes of the clique
+    """
+    nodes, adjacency = index_graph(graph)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    clique, _ = clique_search(bitset_adjacency(adjacency), deadline)
+    return [nodes[v] for v in clique]
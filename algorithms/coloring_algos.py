@@ -0,0 +1,597 @@
+import heapq
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from algorithms.graph_algos import welsh_powell
+
+
+def index_graph(graph):
+    """
+    Index a {node: neighbors} graph as integer adjacency lists
+
+    Edges are made symmetric, duplicates and self loops are dropped, and
+    neighbors that are not keys of the dict are appended as extra nodes.
+
+    Returns:
+        tuple: (nodes, adjacency) where adjacency[i] lists the indices of the
+            neighbors of nodes[i]
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for v in neighbors:
+            if v not in index:
+                index[v] = len(nodes)
+                nodes.append(v)
+
+    adjacency = [[] for _ in nodes]
+    for u, neighbors in graph.items():
+        i = index[u]
+        for v in neighbors:
+            j = index[v]
+            if i != j:
+                adjacency[i].append(j)
+                adjacency[j].append(i)
+
+    # Drop the duplicates left by edges listed from both ends
+    seen = [-1] * len(nodes)
+    for i, neighbors in enumerate(adjacency):
+        unique = []
+        for j in neighbors:
+            if seen[j] != i:
+                seen[j] = i
+                unique.append(j)
+        adjacency[i] = unique
+
+    return nodes, adjacency
+
+
+def degeneracy_order(adjacency):
+    """
+    Batagelj-Zaversnik bucket peeling in O(V + E)
+
+    Returns:
+        tuple: (order, core) where order lists the vertices by repeatedly
+            removing one of minimum remaining degree and core[v] is the core
+            number of v
+    """
+    n = len(adjacency)
+    degree = [len(neighbors) for neighbors in adjacency]
+    max_degree = max(degree, default=0)
+
+    # Counting sort of the vertices by degree
+    bin_start = [0] * (max_degree + 1)
+    for d in degree:
+        bin_start[d] += 1
+    start = 0
+    for d in range(max_degree + 1):
+        count = bin_start[d]
+        bin_start[d] = start
+        start += count
+    position = [0] * n
+    order = [0] * n
+    for v in range(n):
+        position[v] = bin_start[degree[v]]
+        order[position[v]] = v
+        bin_start[degree[v]] += 1
+    for d in range(max_degree, 0, -1):
+        bin_start[d] = bin_start[d - 1]
+    bin_start[0] = 0
+
+    # Peel the vertices, moving each affected neighbor one bucket down
+    for i in range(n):
+        v = order[i]
+        for u in adjacency[v]:
+            if degree[u] > degree[v]:
+                du = degree[u]
+                pu = position[u]
+                pw = bin_start[du]
+                w = order[pw]
+                if u != w:
+                    order[pu], order[pw] = w, u
+                    position[u], position[w] = pw, pu
+                bin_start[du] += 1
+                degree[u] -= 1
+
+    return order, degree
+
+
+def largest_first_order(adjacency):
+    """Vertices by decreasing degree, ties kept in natural order (bucket sort)"""
+    buckets = {}
+    for v, neighbors in enumerate(adjacency):
+        buckets.setdefault(len(neighbors), []).append(v)
+    order = []
+    for d in sorted(buckets, reverse=True):
+        order.extend(buckets[d])
+    return order
+
+
+def smallest_last_order(adjacency):
+    """Reverse of the minimum-degree peeling order"""
+    order, _ = degeneracy_order(adjacency)
+    return order[::-1]
+
+
+def incidence_degree_order(adjacency):
+    """Repeatedly pick the vertex with the most already ordered neighbors"""
+    n = len(adjacency)
+    incidence = [0] * n
+    done = [False] * n
+    # Bucket queue with lazy deletion, keyed by incidence degree
+    buckets = [list(range(n - 1, -1, -1))] if n else []
+    top = 0
+    order = []
+    while len(order) < n:
+        while not buckets[top]:
+            top -= 1
+        v = buckets[top].pop()
+        if done[v] or incidence[v] != top:
+            continue
+        done[v] = True
+        order.append(v)
+        for u in adjacency[v]:
+            if not done[u]:
+                incidence[u] += 1
+                if incidence[u] == len(buckets):
+                    buckets.append([])
+                buckets[incidence[u]].append(u)
+                top = max(top, incidence[u])
+    return order
+
+
+ORDERINGS = {
+    'natural': lambda adjacency: range(len(adjacency)),
+    'largest_first': largest_first_order,
+    'smallest_last': smallest_last_order,
+    'incidence_degree': incidence_degree_order,
+}
+
+
+def color_in_order(adjacency, order):
+    """
+    First-fit coloring of the vertices in the given order
+
+    Forbidden colors are marked in one reusable array stamped with the current
+    vertex, so nothing is allocated per vertex.
+
+    Returns:
+        list: color of each vertex, starting at 1
+    """
+    n = len(adjacency)
+    colors = [0] * n
+    mark = [-1] * (n + 2)
+    for v in order:
+        for u in adjacency[v]:
+            mark[colors[u]] = v
+        color = 1
+        while mark[color] == v:
+            color += 1
+        colors[v] = color
+    return colors
+
+
+def dsatur_colors(adjacency):
+    """
+    DSatur: always color the vertex whose neighbors use the most distinct colors
+
+    The priority queue is a heap keyed by (saturation, uncolored degree) with
+    lazy deletion, and saturations are updated incrementally when a neighbor
+    gets colored, for O((V + E) log V) overall.
+
+    Returns:
+        tuple: (order, colors) with the coloring order and the color of each
+            vertex, starting at 1
+    """
+    n = len(adjacency)
+    colors = [0] * n
+    neighbor_colors = [set() for _ in range(n)]
+    degree = [len(neighbors) for neighbors in adjacency]
+    priority_queue = [(0, -degree[v], v) for v in range(n)]
+    heapq.heapify(priority_queue)
+    order = []
+
+    while priority_queue:
+        saturation, uncolored_degree, v = heapq.heappop(priority_queue)
+        # Skip entries left behind by later updates
+        if colors[v] or -saturation != len(neighbor_colors[v]) or -uncolored_degree != degree[v]:
+            continue
+
+        color = 1
+        while color in neighbor_colors[v]:
+            color += 1
+        colors[v] = color
+        order.append(v)
+
+        for u in adjacency[v]:
+            if not colors[u]:
+                degree[u] -= 1
+                neighbor_colors[u].add(color)
+                heapq.heappush(priority_queue, (-len(neighbor_colors[u]), -degree[u], u))
+
+    return order, colors
+
+
+def greedy_coloring(graph, strategy='natural'):
+    """
+    Greedy coloring with a selectable vertex ordering, in O(V + E)
+
+    Edges are undirected: a neighbor listed by one node only still keeps
+    both colors apart. coloration_glouton() reads the lists as given, so in
+    natural order the two agree on symmetric graphs only; on one-sided
+    lists it can give adjacent nodes the same color.
+
+    Args:
+        graph: Graph as {node: [neighbors]}, like coloration_glouton's input
+        strategy: 'natural', 'largest_first', 'smallest_last', 'incidence_degree'
+            or 'dsatur'
+
+    Returns:
+        dict: {node: color} with colors starting at 1, in coloring order
+    """
+    if strategy != 'dsatur' and strategy not in ORDERINGS:
+        raise ValueError(f"Unknown coloring strategy: {strategy}")
+    nodes, adjacency = index_graph(graph)
+    if strategy == 'dsatur':
+        order, colors = dsatur_colors(adjacency)
+    else:
+        order = list(ORDERINGS[strategy](adjacency))
+        colors = color_in_order(adjacency, order)
+    return {nodes[v]: colors[v] for v in order}
+
+
+
+#parallel speculative coloring for very large graphs
+
+
+def edge_arrays(adjacency):
+    """
+    CSR form of integer adjacency lists
+
+    Returns:
+        tuple: (indptr, indices, src) NumPy arrays, where the neighbors of v are
+            indices[indptr[v]:indptr[v + 1]] and src[k] is the endpoint that
+            owns entry k, so (src, indices) lists every edge in both directions
+    """
+    n = len(adjacency)
+    counts = np.fromiter((len(neighbors) for neighbors in adjacency), dtype=np.int64, count=n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.fromiter(chain.from_iterable(adjacency), dtype=np.int64, count=int(indptr[-1]))
+    src = np.repeat(np.arange(n, dtype=np.int64), counts)
+    return indptr, indices, src
+
+
+def smallest_free_colors(chosen, src, dst, colors):
+    """Smallest color (from 1) unused by the colored neighbors of each chosen vertex"""
+    n = len(colors)
+    free = np.ones(n, dtype=np.int64)
+    selected = chosen[src] & (colors[dst] > 0)
+    s = src[selected]
+    c = colors[dst[selected]]
+    if s.size:
+        # Sorted distinct (vertex, neighbor color) pairs
+        base = int(c.max()) + 2
+        keys = np.unique(s * base + c)
+        s = keys // base
+        c = keys % base
+        starts = np.flatnonzero(np.r_[True, s[1:] != s[:-1]])
+        sizes = np.diff(np.r_[starts, s.size])
+        rank = np.arange(s.size) - np.repeat(starts, sizes)
+
+        # Without a gap the answer is one past the colors in use
+        free[s[starts]] = sizes + 1
+        gaps = np.flatnonzero(c != rank + 1)
+        if gaps.size:
+            first_vertices, first = np.unique(s[gaps], return_index=True)
+            free[first_vertices] = rank[gaps[first]] + 1
+    return free[chosen]
+
+
+def jones_plassmann_colors(n, src, dst, seed=None):
+    """
+    Jones-Plassmann coloring over edge arrays with vectorized rounds
+
+    Every vertex gets a random priority. Each round colors, all at once, the
+    uncolored vertices whose priority beats every uncolored neighbor; they
+    form an independent set, so first-fit colors cannot clash.
+
+    Returns:
+        np.ndarray: color of each vertex, starting at 1
+    """
+    rng = np.random.default_rng(seed)
+    priority = rng.permutation(n)
+    colors = np.zeros(n, dtype=np.int64)
+    uncolored = np.ones(n, dtype=bool)
+
+    while uncolored.any():
+        # Local maxima among the uncolored vertices
+        both = uncolored[dst]
+        local_max = uncolored.copy()
+        beaten = both & (priority[dst] > priority[src])
+        local_max[src[beaten]] = False
+
+        colors[local_max] = smallest_free_colors(local_max, src, dst, colors)
+        uncolored &= ~local_max
+
+        # Only edges leaving uncolored vertices matter from now on
+        keep = uncolored[src]
+        src = src[keep]
+        dst = dst[keep]
+
+    return colors
+
+
+block_indptr = None
+block_indices = None
+block_mark = None
+block_stamp = 0
+block_memory = None
+block_colors = None
+
+
+def init_block_worker(indptr, indices, colors_name):
+    """Keep the adjacency and attach the shared colors in each worker process"""
+    global block_indptr, block_indices, block_mark, block_memory, block_colors
+    block_indptr = indptr.tolist()
+    block_indices = indices.tolist()
+    max_degree = max((b - a for a, b in zip(block_indptr, block_indptr[1:])), default=0)
+    block_mark = [0] * (max_degree + 2)
+    block_memory = shared_memory.SharedMemory(name=colors_name)
+    block_colors = block_memory.buf.cast('q')
+
+
+def color_block(block):
+    """
+    First-fit color one block of vertices in the shared colors
+
+    Colors are read and written in shared memory as the block goes, so
+    every worker sees what the others have colored so far. Forbidden colors
+    are stamped with a counter that keeps growing across vertices and
+    rounds, so marks left by earlier calls never block a color.
+    """
+    global block_stamp
+    colors = block_colors
+    mark = block_mark
+    size = len(mark)
+    stamp = block_stamp
+    for v in block.tolist():
+        stamp += 1
+        for u in block_indices[block_indptr[v]:block_indptr[v + 1]]:
+            if colors[u] < size:
+                mark[colors[u]] = stamp
+        color = 1
+        while mark[color] == stamp:
+            color += 1
+        colors[v] = color
+    block_stamp = stamp
+
+
+def speculative_colors(indptr, indices, src, workers, seed=None):
+    """
+    Gebremedhin-Manne speculative coloring across worker processes
+
+    The pending vertices are split into one block per worker and colored
+    concurrently in a shared-memory color array, so a task carries its block
+    only. Edges whose endpoints got the same color in different blocks are
+    then detected with array operations, the lower priority endpoint is
+    uncolored, and the next round recolors only those vertices.
+
+    Returns:
+        np.ndarray: color of each vertex, starting at 1
+    """
+    n = len(indptr) - 1
+    rng = np.random.default_rng(seed)
+    priority = rng.permutation(n)
+    pending = np.arange(n, dtype=np.int64)
+    dst = indices
+
+    memory = shared_memory.SharedMemory(create=True, size=max(n, 1) * np.dtype(np.int64).itemsize)
+    try:
+        colors = np.ndarray((n,), dtype=np.int64, buffer=memory.buf)
+        try:
+            colors.fill(0)
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_block_worker,
+                                     initargs=(indptr, indices, memory.name)) as pool:
+                while pending.size:
+                    list(pool.map(color_block, np.array_split(pending, workers)))
+
+                    # Conflict resolution: the higher priority endpoint keeps its color
+                    conflict = (colors[src] == colors[dst]) & (priority[src] < priority[dst])
+                    in_pending = np.zeros(n, dtype=bool)
+                    in_pending[src[conflict]] = True
+                    pending = np.flatnonzero(in_pending)
+                    colors[pending] = 0
+
+                    # Only edges between pending vertices can clash in later rounds
+                    keep = in_pending[src] & in_pending[dst]
+                    src = src[keep]
+                    dst = dst[keep]
+            return colors.copy()
+        finally:
+            del colors
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def parallel_coloring(graph, workers=None, seed=None):
+    """
+    Parallel coloring for very large graphs
+
+    Args:
+        graph: Graph as {node: [neighbors]}, like coloration_glouton's input
+        workers: Number of worker processes. None or 1 runs vectorized
+            Jones-Plassmann rounds in this process; more splits the vertices
+            across processes with a conflict resolution pass
+        seed: Seed for the random priorities
+
+    Returns:
+        dict: {node: color} with colors starting at 1
+    """
+    nodes, adjacency = index_graph(graph)
+    indptr, indices, src = edge_arrays(adjacency)
+    if workers is None or workers <= 1:
+        colors = jones_plassmann_colors(len(nodes), src, indices, seed)
+    else:
+        colors = speculative_colors(indptr, indices, src, workers, seed)
+    return dict(zip(nodes, colors.tolist()))
+
+
+
+#anytime improvement of a coloring with Kempe chains and tabu search
+
+
+def kempe_recolor(adjacency, colors, v, k, deadline):
+    """
+    Move v to one of the colors 0..k-1 without creating conflicts
+
+    A free color is used directly. Otherwise an (a, b) Kempe chain through
+    the a-colored neighbors of v is swapped when it reaches no b-colored
+    neighbor of v, which frees color a for v.
+    """
+    used = {colors[u] for u in adjacency[v]}
+    for c in range(k):
+        if c not in used:
+            colors[v] = c
+            return True
+
+    for a in range(k):
+        start = [u for u in adjacency[v] if colors[u] == a]
+        for b in range(k):
+            if a == b or time.perf_counter() > deadline:
+                continue
+            # Grow the chain over the vertices colored a or b
+            chain_nodes = set(start)
+            stack = list(start)
+            while stack:
+                x = stack.pop()
+                for y in adjacency[x]:
+                    if y != v and y not in chain_nodes and colors[y] in (a, b):
+                        chain_nodes.add(y)
+                        stack.append(y)
+            if any(colors[u] == b and u in chain_nodes for u in adjacency[v]):
+                continue
+            for x in chain_nodes:
+                colors[x] = b if colors[x] == a else a
+            colors[v] = a
+            return True
+
+    return False
+
+
+def tabucol(adjacency, colors, k, deadline, rng):
+    """
+    Tabucol search for a conflict-free k-coloring, in place
+
+    gamma[v][c] counts the neighbors of v colored c, so the change in
+    conflicts of moving v to c is gamma[v][c] - gamma[v][colors[v]] and each
+    move is evaluated in O(1).
+
+    Returns:
+        bool: True if a proper k-coloring was reached before the deadline
+    """
+    n = len(adjacency)
+    gamma = [[0] * k for _ in range(n)]
+    for v in range(n):
+        for u in adjacency[v]:
+            gamma[v][colors[u]] += 1
+    conflicting = {v for v in range(n) if gamma[v][colors[v]] > 0}
+    conflicts = sum(gamma[v][colors[v]] for v in conflicting) // 2
+    if k < 2:
+        return conflicts == 0
+    best_conflicts = conflicts
+    tabu = [[0] * k for _ in range(n)]
+    iteration = 0
+
+    while conflicts > 0:
+        if time.perf_counter() > deadline:
+            return False
+        iteration += 1
+
+        # Best non-tabu move, tabu ones allowed if they beat the best seen
+        best_delta = float('inf')
+        moves = []
+        for v in conflicting:
+            row = gamma[v]
+            current = row[colors[v]]
+            for c in range(k):
+                if c == colors[v]:
+                    continue
+                delta = row[c] - current
+                if tabu[v][c] > iteration and conflicts + delta >= best_conflicts:
+                    continue
+                if delta < best_delta:
+                    best_delta = delta
+                    moves = [(v, c)]
+                elif delta == best_delta:
+                    moves.append((v, c))
+        if moves:
+            v, c = rng.choice(moves)
+        else:
+            v = rng.choice(list(conflicting))
+            c = rng.choice([c for c in range(k) if c != colors[v]])
+            best_delta = gamma[v][c] - gamma[v][colors[v]]
+
+        # Apply the move and update the neighbor counters
+        old = colors[v]
+        colors[v] = c
+        conflicts += best_delta
+        tabu[v][old] = iteration + int(0.6 * len(conflicting)) + rng.randint(0, 9)
+        for u in adjacency[v]:
+            gamma[u][old] -= 1
+            gamma[u][c] += 1
+            if gamma[u][colors[u]] > 0:
+                conflicting.add(u)
+            else:
+                conflicting.discard(u)
+        if gamma[v][c] > 0:
+            conflicting.add(v)
+        else:
+            conflicting.discard(v)
+        best_conflicts = min(best_conflicts, conflicts)
+
+    return True
+
+
+def improve_coloring(graph, time_limit=1.0, seed=None):
+    """
+    Anytime coloring improvement starting from welsh_powell()
+
+    While time remains, the highest color class is emptied (Kempe chain
+    moves first, random colors for what is left) and Tabucol repairs the
+    conflicts. Every success saves one color.
+
+    Args:
+        graph: Graph as {node: [neighbors]}
+        time_limit: Wall-clock budget in seconds
+        seed: Seed for the tabu search
+
+    Returns:
+        tuple: (coloring, k) with the best {node: color} found and its number
+            of colors
+    """
+    deadline = time.perf_counter() + time_limit
+    rng = random.Random(seed)
+    nodes, adjacency = index_graph(graph)
+    initial = welsh_powell({nodes[v]: [nodes[u] for u in adjacency[v]] for v in range(len(nodes))})
+    colors = [initial[node] - 1 for node in nodes]
+    k = max(colors) + 1 if colors else 0
+
+    while k > 1 and time.perf_counter() < deadline:
+        candidate = colors[:]
+        top = [v for v in range(len(nodes)) if candidate[v] == k - 1]
+        for v in top:
+            if not kempe_recolor(adjacency, candidate, v, k - 1, deadline):
+                candidate[v] = rng.randrange(k - 1)
+        if not tabucol(adjacency, candidate, k - 1, deadline, rng):
+            break
+        colors = candidate
+        k -= 1
+
+    return {node: colors[v] + 1 for v, node in enumerate(nodes)}, k
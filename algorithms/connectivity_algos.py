@@ -0,0 +1,328 @@
+from collections import deque
+
+
+def index_digraph(graph):
+    """
+    Index a directed {node: neighbors} graph as integer adjacency lists
+
+    Neighbors may be a list or a {neighbor: weight} dict. Neighbors that are
+    not keys of the dict are appended as extra nodes.
+
+    Returns:
+        tuple: (nodes, index, adjacency)
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for v in neighbors:
+            if v not in index:
+                index[v] = len(nodes)
+                nodes.append(v)
+    adjacency = [[] for _ in nodes]
+    for u, neighbors in graph.items():
+        adjacency[index[u]] = [index[v] for v in neighbors]
+    return nodes, index, adjacency
+
+
+def tarjan_scc(adjacency):
+    """
+    Iterative Tarjan strongly connected components in O(V + E)
+
+    Returns:
+        list: component id of each vertex, numbered in topological order of
+            the condensation (edges only go from lower to higher ids)
+    """
+    n = len(adjacency)
+    order = [-1] * n
+    low = [0] * n
+    next_edge = [0] * n
+    on_stack = [False] * n
+    stack = []
+    component = [-1] * n
+    found = 0
+    counter = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [root]
+
+        while work:
+            v = work[-1]
+            if next_edge[v] < len(adjacency[v]):
+                w = adjacency[v][next_edge[v]]
+                next_edge[v] += 1
+                if order[w] == -1:
+                    # Descend into an unvisited vertex
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append(w)
+                elif on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+            else:
+                work.pop()
+                if work and low[v] < low[work[-1]]:
+                    low[work[-1]] = low[v]
+                if low[v] == order[v]:
+                    # v is the root of a component, pop it off the stack
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = found
+                        if w == v:
+                            break
+                    found += 1
+
+    # Tarjan finds sink components first, flip to topological order
+    return [found - 1 - c for c in component]
+
+
+def strongly_connected_components(graph):
+    """
+    Strongly connected components of a directed graph
+
+    Returns:
+        list: components as lists of nodes, in topological order
+    """
+    nodes, _, adjacency = index_digraph(graph)
+    component = tarjan_scc(adjacency)
+    components = [[] for _ in range(max(component, default=-1) + 1)]
+    for v, c in enumerate(component):
+        components[c].append(nodes[v])
+    return components
+
+
+def condensation(graph):
+    """
+    Condensation DAG of a directed graph
+
+    Returns:
+        tuple: (component_of, dag, components) where component_of maps each
+            node to its component id, dag is {component: [successor components]}
+            and components lists the nodes of each component. Ids follow a
+            topological order of the DAG.
+    """
+    nodes, _, adjacency = index_digraph(graph)
+    component = tarjan_scc(adjacency)
+    count = max(component, default=-1) + 1
+    members = [[] for _ in range(count)]
+    for v, c in enumerate(component):
+        members[c].append(v)
+
+    # Successor components, deduplicated with a stamp per component
+    dag = {c: [] for c in range(count)}
+    seen = [-1] * count
+    for c in range(count):
+        seen[c] = c
+        for v in members[c]:
+            for w in adjacency[v]:
+                d = component[w]
+                if seen[d] != c:
+                    seen[d] = c
+                    dag[c].append(d)
+
+    components = [[nodes[v] for v in vertices] for vertices in members]
+    component_of = {nodes[v]: c for v, c in enumerate(component)}
+    return component_of, dag, components
+
+
+def find_root(parent, v):
+    """Union-find root with path halving"""
+    while parent[v] != v:
+        parent[v] = parent[parent[v]]
+        v = parent[v]
+    return v
+
+
+def weakly_connected_components(graph):
+    """
+    Weakly connected components with an array union-find
+
+    Returns:
+        list: components as lists of nodes
+    """
+    nodes, _, adjacency = index_digraph(graph)
+    n = len(nodes)
+    parent = list(range(n))
+    size = [1] * n
+    for u in range(n):
+        for v in adjacency[u]:
+            root_u = find_root(parent, u)
+            root_v = find_root(parent, v)
+            if root_u != root_v:
+                # Union by size
+                if size[root_u] < size[root_v]:
+                    root_u, root_v = root_v, root_u
+                parent[root_v] = root_u
+                size[root_u] += size[root_v]
+
+    label = {}
+    components = []
+    for v in range(n):
+        root = find_root(parent, v)
+        if root not in label:
+            label[root] = len(components)
+            components.append([])
+        components[label[root]].append(nodes[v])
+    return components
+
+
+def reachable_components(dag, start):
+    """Components reachable from start in the condensation DAG"""
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        c = queue.popleft()
+        for d in dag[c]:
+            if d not in reached:
+                reached.add(d)
+                queue.append(d)
+    return reached
+
+
+def prune_unreachable(graph, source, sink=None):
+    """
+    Restrict a graph to the part that matters for a query from source
+
+    Components that cannot be reached from the source are dropped, and with a
+    sink also the components that cannot reach the sink. Neighbor lists or
+    weight dicts keep their original form.
+
+    Returns:
+        dict: the pruned graph
+    """
+    component_of, dag, _ = condensation(graph)
+    if source not in component_of:
+        return {}
+    keep = reachable_components(dag, component_of[source])
+    if sink is not None:
+        if sink not in component_of:
+            return {}
+        # Components that reach the sink, found on the reversed DAG
+        reverse_dag = {c: [] for c in dag}
+        for c, successors in dag.items():
+            for d in successors:
+                reverse_dag[d].append(c)
+        keep &= reachable_components(reverse_dag, component_of[sink])
+
+    pruned = {}
+    for u, neighbors in graph.items():
+        if component_of[u] not in keep:
+            continue
+        if isinstance(neighbors, dict):
+            pruned[u] = {v: w for v, w in neighbors.items() if component_of[v] in keep}
+        else:
+            pruned[u] = [v for v in neighbors if component_of[v] in keep]
+    return pruned
+
+
+def undirected_adjacency(adjacency):
+    """Symmetric copy of integer adjacency lists without duplicates or self loops"""
+    n = len(adjacency)
+    undirected = [[] for _ in range(n)]
+    for u in range(n):
+        for v in adjacency[u]:
+            if u != v:
+                undirected[u].append(v)
+                undirected[v].append(u)
+    seen = [-1] * n
+    for u in range(n):
+        unique = []
+        for v in undirected[u]:
+            if seen[v] != u:
+                seen[v] = u
+                unique.append(v)
+        undirected[u] = unique
+    return undirected
+
+
+def biconnectivity(graph):
+    """
+    Articulation points, bridges and biconnected components in O(V + E)
+
+    The graph is treated as undirected. The lowlink DFS keeps an explicit
+    stack of vertices and one of edges, so it never recurses and works on
+    graphs with millions of edges.
+
+    Returns:
+        dict: Result containing:
+            - 'articulation_points': nodes whose removal disconnects the graph
+            - 'bridges': (u, v) edges whose removal disconnects the graph
+            - 'biconnected_components': components as lists of nodes
+    """
+    nodes, _, adjacency = index_digraph(graph)
+    adjacency = undirected_adjacency(adjacency)
+    n = len(nodes)
+    discovery = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    next_edge = [0] * n
+    is_cut = [False] * n
+    bridges = []
+    components = []
+    edge_stack = []
+    counter = 0
+
+    for root in range(n):
+        if discovery[root] != -1:
+            continue
+        discovery[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        work = [root]
+
+        while work:
+            v = work[-1]
+            if next_edge[v] < len(adjacency[v]):
+                w = adjacency[v][next_edge[v]]
+                next_edge[v] += 1
+                if discovery[w] == -1:
+                    # Tree edge
+                    parent[w] = v
+                    discovery[w] = low[w] = counter
+                    counter += 1
+                    edge_stack.append((v, w))
+                    work.append(w)
+                    if v == root:
+                        root_children += 1
+                elif w != parent[v] and discovery[w] < discovery[v]:
+                    # Back edge to an ancestor
+                    if discovery[w] < low[v]:
+                        low[v] = discovery[w]
+                    edge_stack.append((v, w))
+            else:
+                work.pop()
+                if not work:
+                    continue
+                u = parent[v]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+                if low[v] > discovery[u]:
+                    bridges.append((nodes[u], nodes[v]))
+                if low[v] >= discovery[u]:
+                    if u != root:
+                        is_cut[u] = True
+                    # Everything above the tree edge (u, v) forms one component
+                    members = set()
+                    while True:
+                        a, b = edge_stack.pop()
+                        members.add(a)
+                        members.add(b)
+                        if (a, b) == (u, v):
+                            break
+                    components.append([nodes[x] for x in members])
+
+        if root_children > 1:
+            is_cut[root] = True
+
+    return {
+        'articulation_points': [nodes[v] for v in range(n) if is_cut[v]],
+        'bridges': bridges,
+        'biconnected_components': components,
+    }
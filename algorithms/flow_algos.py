@@ -0,0 +1,433 @@
+import heapq
+from collections import deque
+
+from algorithms.matching_algos import bipartite_max_flow
+
+
+def build_arc_network(graph, with_costs=False):
+    """Index a dict flow network and build paired residual arcs
+
+    Arc ``e`` and its reverse arc ``e ^ 1`` are stored next to each other, so
+    the flow currently sent on a forward arc is the residual capacity of its
+    reverse arc.
+
+    Args:
+        graph: Flow network as {u: {v: capacity}}, or {u: {v: (capacity, cost)}}
+            when with_costs is True
+        with_costs: Whether edge values are (capacity, cost) pairs
+
+    Returns:
+        tuple: (nodes, index, adjacency, head, capacity, cost) where nodes is
+            the list of node labels, index maps labels to positions, adjacency
+            lists the arc ids leaving each node and head/capacity/cost are
+            per-arc lists
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    for neighbors in graph.values():
+        for v in neighbors:
+            if v not in index:
+                index[v] = len(nodes)
+                nodes.append(v)
+
+    adjacency = [[] for _ in nodes]
+    head = []
+    capacity = []
+    cost = []
+    for u, neighbors in graph.items():
+        for v, value in neighbors.items():
+            edge_capacity, edge_cost = value if with_costs else (value, 0)
+            arc = len(head)
+            # Forward arc
+            head.append(index[v])
+            capacity.append(edge_capacity)
+            cost.append(edge_cost)
+            adjacency[index[u]].append(arc)
+            # Reverse arc with no capacity
+            head.append(index[u])
+            capacity.append(0)
+            cost.append(-edge_cost)
+            adjacency[index[v]].append(arc + 1)
+
+    return nodes, index, adjacency, head, capacity, cost
+
+
+def arc_flow_network(graph, capacity):
+    """Rebuild a {u: {v: flow}} dict from the reverse arc capacities"""
+    flow_network = {u: {} for u in graph}
+    arc = 0
+    for u, neighbors in graph.items():
+        for v in neighbors:
+            flow_network[u][v] = capacity[arc + 1]
+            arc += 2
+    return flow_network
+
+
+
+#min cost flow with successive shortest paths or cost scaling
+
+
+def min_cost_flow(graph, source, sink, max_flow=None, method='ssp'):
+    """
+    Minimum cost maximum flow
+
+    Args:
+        graph: Flow network as {u: {v: (capacity, cost)}}
+        source: Source node
+        sink: Sink node
+        max_flow: Optional cap on the amount of flow to send
+        method: 'ssp' for successive shortest paths with Johnson potentials,
+            'cost_scaling' for Goldberg-Tarjan cost scaling (integer costs only)
+
+    Returns:
+        tuple: (flow_value, total_cost, flow_network) where flow_network has
+            the same {u: {v: flow}} shape as ford_fulkerson's output
+    """
+    nodes, index, adjacency, head, capacity, cost = build_arc_network(graph, with_costs=True)
+    if source not in index or sink not in index:
+        raise ValueError("Source or sink node not in flow network")
+    s, t = index[source], index[sink]
+    limit = float('inf') if max_flow is None else max_flow
+
+    if s == t:
+        flow_value = 0
+    elif method == 'ssp':
+        flow_value = successive_shortest_paths(adjacency, head, capacity, cost, s, t, limit)
+    elif method == 'cost_scaling':
+        flow_value = cost_scaling(adjacency, head, capacity, cost, s, t, limit)
+    else:
+        raise ValueError(f"Unknown min cost flow method: {method}")
+
+    flow_network = arc_flow_network(graph, capacity)
+    total_cost = 0
+    for u, neighbors in graph.items():
+        for v, (_, edge_cost) in neighbors.items():
+            total_cost += flow_network[u][v] * edge_cost
+
+    return flow_value, total_cost, flow_network
+
+
+def initial_potentials(adjacency, head, capacity, cost, s):
+    """Bellman-Ford potentials so that reduced costs start non-negative"""
+    n = len(adjacency)
+    potential = [float('inf')] * n
+    potential[s] = 0
+
+    # Relax all arcs with capacity at most |V| - 1 times
+    for _ in range(n - 1):
+        updated = False
+        for u in range(n):
+            if potential[u] == float('inf'):
+                continue
+            for arc in adjacency[u]:
+                v = head[arc]
+                if capacity[arc] > 0 and potential[u] + cost[arc] < potential[v]:
+                    potential[v] = potential[u] + cost[arc]
+                    updated = True
+        if not updated:
+            break
+    else:
+        # Check for negative cost cycles
+        for u in range(n):
+            if potential[u] == float('inf'):
+                continue
+            for arc in adjacency[u]:
+                if capacity[arc] > 0 and potential[u] + cost[arc] < potential[head[arc]]:
+                    raise ValueError("Negative cost cycle reachable from source")
+
+    # Nodes unreachable from the source can never join an augmenting path
+    return [p if p != float('inf') else 0 for p in potential]
+
+
+def successive_shortest_paths(adjacency, head, capacity, cost, s, t, limit):
+    """Augment along cheapest paths found by Dijkstra on reduced costs"""
+    n = len(adjacency)
+    if any(cost[arc] < 0 for arc in range(0, len(head), 2)):
+        potential = initial_potentials(adjacency, head, capacity, cost, s)
+    else:
+        potential = [0] * n
+    flow_value = 0
+
+    while flow_value < limit:
+        distances = [float('inf')] * n
+        parent_arc = [-1] * n
+        distances[s] = 0
+        priority_queue = [(0, s)]
+
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            if current_distance > distances[u]:
+                continue
+            for arc in adjacency[u]:
+                if capacity[arc] <= 0:
+                    continue
+                v = head[arc]
+                distance = current_distance + cost[arc] + potential[u] - potential[v]
+                if distance < distances[v]:
+                    distances[v] = distance
+                    parent_arc[v] = arc
+                    heapq.heappush(priority_queue, (distance, v))
+
+        if distances[t] == float('inf'):
+            break
+
+        # Keep reduced costs non-negative for the next round
+        for u in range(n):
+            if distances[u] != float('inf'):
+                potential[u] += distances[u]
+
+        # Find minimum residual capacity of the path
+        path_flow = limit - flow_value
+        v = t
+        while v != s:
+            arc = parent_arc[v]
+            path_flow = min(path_flow, capacity[arc])
+            v = head[arc ^ 1]
+
+        # Update residual capacities and reverse arcs
+        v = t
+        while v != s:
+            arc = parent_arc[v]
+            capacity[arc] -= path_flow
+            capacity[arc ^ 1] += path_flow
+            v = head[arc ^ 1]
+
+        flow_value += path_flow
+
+    return flow_value
+
+
+def cost_scaling(adjacency, head, capacity, cost, s, t, limit):
+    """Goldberg-Tarjan cost scaling push-relabel for a fixed flow value"""
+    if any(cost[arc] != int(cost[arc]) for arc in range(len(head))):
+        raise ValueError("Cost scaling requires integer edge costs")
+
+    # The flow value is fixed up front by a plain max flow on a copy
+    target = min(limit, augment_paths(adjacency, head, list(capacity), s, t))
+    n = len(adjacency)
+    excess = [0] * n
+    excess[s] = target
+    excess[t] = -target
+    if target == 0:
+        return 0
+
+    # Costs are multiplied by n + 1 so that 1-optimality implies optimality
+    scale = n + 1
+    scaled = [int(c) * scale for c in cost]
+    price = [0] * n
+    epsilon = max(1, max(abs(c) for c in scaled))
+
+    while True:
+        epsilon = max(1, epsilon // 2)
+        refine(adjacency, head, capacity, scaled, price, excess, epsilon)
+        if epsilon == 1:
+            break
+
+    return target
+
+
+def refine(adjacency, head, capacity, cost, price, excess, epsilon):
+    """Turn an 2*epsilon-optimal flow into an epsilon-optimal one"""
+    n = len(adjacency)
+
+    # Saturate every residual arc with negative reduced cost
+    for u in range(n):
+        for arc in adjacency[u]:
+            v = head[arc]
+            if capacity[arc] > 0 and cost[arc] + price[u] - price[v] < 0:
+                delta = capacity[arc]
+                capacity[arc] = 0
+                capacity[arc ^ 1] += delta
+                excess[u] -= delta
+                excess[v] += delta
+
+    active = deque(u for u in range(n) if excess[u] > 0)
+    in_queue = [excess[u] > 0 for u in range(n)]
+    current_arc = [0] * n
+
+    while active:
+        u = active.popleft()
+        in_queue[u] = False
+        arcs = adjacency[u]
+        while excess[u] > 0:
+            if current_arc[u] == len(arcs):
+                # Relabel: lower the price just enough to create an admissible arc
+                best = -float('inf')
+                for arc in arcs:
+                    if capacity[arc] > 0:
+                        best = max(best, price[head[arc]] - cost[arc])
+                price[u] = best - epsilon
+                current_arc[u] = 0
+                continue
+
+            arc = arcs[current_arc[u]]
+            v = head[arc]
+            if capacity[arc] > 0 and cost[arc] + price[u] - price[v] < 0:
+                # Push along the admissible arc
+                delta = min(excess[u], capacity[arc])
+                capacity[arc] -= delta
+                capacity[arc ^ 1] += delta
+                excess[u] -= delta
+                excess[v] += delta
+                if excess[v] > 0 and not in_queue[v]:
+                    active.append(v)
+                    in_queue[v] = True
+            else:
+                current_arc[u] += 1
+
+
+def augment_paths(adjacency, head, capacity, s, t, limit=float('inf')):
+    """Push up to limit units from s to t along BFS augmenting paths
+
+    Works directly on the arc lists (capacity is modified) and returns the
+    amount of flow that was pushed.
+    """
+    pushed = 0
+    while pushed < limit:
+        parent_arc = [-1] * len(adjacency)
+        parent_arc[s] = -2
+        queue = deque([s])
+        while queue and parent_arc[t] == -1:
+            u = queue.popleft()
+            for arc in adjacency[u]:
+                v = head[arc]
+                if parent_arc[v] == -1 and capacity[arc] > 0:
+                    parent_arc[v] = arc
+                    queue.append(v)
+        if parent_arc[t] == -1:
+            break
+
+        # Find minimum residual capacity of the path
+        path_flow = limit - pushed
+        v = t
+        while v != s:
+            arc = parent_arc[v]
+            path_flow = min(path_flow, capacity[arc])
+            v = head[arc ^ 1]
+
+        # Update residual capacities and reverse arcs
+        v = t
+        while v != s:
+            arc = parent_arc[v]
+            capacity[arc] -= path_flow
+            capacity[arc ^ 1] += path_flow
+            v = head[arc ^ 1]
+        pushed += path_flow
+
+    return pushed
+
+
+
+#incremental max flow that keeps its residual graph between edits
+
+
+class IncrementalMaxFlow:
+    """
+    Maximum flow that can be re-solved after capacity edits
+
+    The residual arcs are kept between calls, so raising a capacity only
+    searches for the extra augmenting paths and lowering one only reroutes or
+    cancels the flow that no longer fits on that edge. A unit-capacity
+    bipartite network is first solved with Hopcroft-Karp, and the matching
+    seeds the residual arcs.
+    """
+
+    def __init__(self, graph, source, sink):
+        self.graph = {u: dict(neighbors) for u, neighbors in graph.items()}
+        self.nodes, self.index, self.adjacency, self.head, self.capacity, _ = build_arc_network(self.graph)
+        if source not in self.index or sink not in self.index:
+            raise ValueError("Source or sink node not in flow network")
+        self.source = source
+        self.sink = sink
+        self.edge_arc = {}
+        arc = 0
+        for u, neighbors in self.graph.items():
+            for v in neighbors:
+                self.edge_arc[(u, v)] = arc
+                arc += 2
+        self.max_flow = 0
+        matching_flow = bipartite_max_flow(self.graph, source, sink)
+        if matching_flow is not None:
+            self.max_flow, flow_network = matching_flow
+            for (u, v), arc in self.edge_arc.items():
+                flow = flow_network[u][v]
+                self.capacity[arc] -= flow
+                self.capacity[arc ^ 1] += flow
+        self.augment()
+
+    def augment(self):
+        """Push flow along augmenting paths of the current residual graph"""
+        s, t = self.index[self.source], self.index[self.sink]
+        if s != t:
+            self.max_flow += augment_paths(self.adjacency, self.head, self.capacity, s, t)
+        return self.max_flow
+
+    def add_node(self, node):
+        """Register a node that was not part of the network yet"""
+        if node not in self.index:
+            self.index[node] = len(self.nodes)
+            self.nodes.append(node)
+            self.adjacency.append([])
+        return self.index[node]
+
+    def set_capacity(self, u, v, new_capacity):
+        """
+        Change the capacity of edge u -> v and restore a maximum flow
+
+        Missing edges are created. Returns the new maximum flow value.
+        """
+        if (u, v) not in self.edge_arc:
+            a, b = self.add_node(u), self.add_node(v)
+            arc = len(self.head)
+            self.head.extend([b, a])
+            self.capacity.extend([0, 0])
+            self.adjacency[a].append(arc)
+            self.adjacency[b].append(arc + 1)
+            self.edge_arc[(u, v)] = arc
+            self.graph.setdefault(u, {})[v] = 0
+        arc = self.edge_arc[(u, v)]
+        self.graph.setdefault(u, {})[v] = new_capacity
+
+        flow = self.capacity[arc ^ 1]
+        if new_capacity >= flow:
+            # The current flow still fits, only the residual capacity grows or shrinks
+            self.capacity[arc] = new_capacity - flow
+            return self.augment()
+
+        # Cut the flow on the edge down to the new capacity
+        a, b = self.index[u], self.index[v]
+        surplus = flow - new_capacity
+        self.capacity[arc] = 0
+        self.capacity[arc ^ 1] = new_capacity
+
+        # First try to reroute the surplus around the edge
+        rerouted = augment_paths(self.adjacency, self.head, self.capacity, a, b, surplus)
+        remaining = surplus - rerouted
+        if remaining > 0:
+            # Send what is left back to the source and pull it back from the sink
+            s, t = self.index[self.source], self.index[self.sink]
+            if a != s:
+                augment_paths(self.adjacency, self.head, self.capacity, a, s, remaining)
+            if b != t:
+                augment_paths(self.adjacency, self.head, self.capacity, t, b, remaining)
+            self.max_flow -= remaining
+
+        return self.augment()
+
+    def update(self, graph):
+        """Apply every capacity that differs from graph and return the new max flow"""
+        for u, neighbors in graph.items():
+            for v, new_capacity in neighbors.items():
+                if self.graph.get(u, {}).get(v) != new_capacity:
+                    self.set_capacity(u, v, new_capacity)
+        for (u, v) in self.edge_arc:
+            if v not in graph.get(u, {}) and self.graph[u][v] != 0:
+                self.set_capacity(u, v, 0)
+        return self.max_flow
+
+    def flow_network(self):
+        """Current flow as {u: {v: flow}}, like ford_fulkerson's output"""
+        flow_network = {u: {} for u in self.graph}
+        for (u, v), arc in self.edge_arc.items():
+            flow_network[u][v] = self.capacity[arc ^ 1]
+        return flow_network
@@ -0,0 +1,166 @@
+import numpy as np
+from scipy.spatial import Delaunay, QhullError, cKDTree
+
+from algorithms.connectivity_algos import find_root
+
+
+def as_points(points):
+    """Points as an (n, d) float array"""
+    points = np.asarray(points, dtype=float)
+    if points.ndim == 1:
+        points = points[:, None]
+    if points.ndim != 2:
+        raise ValueError("Points must be an (n, d) array of coordinates")
+    return points
+
+
+def edges_to_graph(n, edges, weights, labels=None):
+    """
+    Undirected {node: {neighbor: weight}} graph, the input of prim() and kruskal()
+
+    Nodes are the point indices, or labels[i] when labels are given.
+    """
+    if labels is None:
+        labels = range(n)
+    labels = list(labels)
+    graph = {label: {} for label in labels}
+    for (i, j), weight in zip(edges.tolist(), weights.tolist()):
+        graph[labels[i]][labels[j]] = weight
+        graph[labels[j]][labels[i]] = weight
+    return graph
+
+
+def edge_lengths(points, edges):
+    """Euclidean length of each (i, j) edge"""
+    return np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+
+
+def knn_edges(points, k):
+    """Edges from every point to its k nearest neighbors, deduplicated"""
+    n = len(points)
+    k = min(k, n - 1)
+    if k < 1:
+        return np.empty((0, 2), dtype=np.int64)
+    # Each point is among its own hits, though not always first when points
+    # repeat; drop it, and the extra hit of rows where it was not returned
+    _, neighbors = cKDTree(points).query(points, k=k + 1)
+    rows = np.repeat(np.arange(n)[:, None], k + 1, axis=1)
+    keep = neighbors != rows
+    keep &= np.cumsum(keep, axis=1) <= k
+    edges = np.sort(np.column_stack((rows[keep], neighbors[keep])), axis=1)
+    return np.unique(edges, axis=0)
+
+
+def knn_graph(points, k, labels=None):
+    """
+    k-nearest-neighbor graph of a point set
+
+    An edge joins i and j when either is among the k nearest neighbors of
+    the other, weighted by their Euclidean distance.
+
+    Args:
+        points: (n, d) array-like of coordinates
+        k: Number of neighbors per point
+        labels: Optional node names, one per point
+
+    Returns:
+        dict: {node: {neighbor: distance}}
+    """
+    points = as_points(points)
+    edges = knn_edges(points, k)
+    return edges_to_graph(len(points), edges, edge_lengths(points, edges), labels)
+
+
+def radius_graph(points, radius, labels=None):
+    """
+    Graph joining every pair of points closer than radius
+
+    Returns:
+        dict: {node: {neighbor: distance}}
+    """
+    points = as_points(points)
+    edges = cKDTree(points).query_pairs(radius, output_type='ndarray').astype(np.int64)
+    return edges_to_graph(len(points), edges, edge_lengths(points, edges), labels)
+
+
+def delaunay_edges(points):
+    """
+    Edges of the Delaunay triangulation, a superset of the Euclidean MST
+
+    Degenerate inputs (collinear or cospherical points) are retried with
+    joggled input; one-dimensional and tiny inputs fall back to the sorted
+    chain or the complete graph.
+    """
+    n, d = points.shape
+    if d == 1:
+        order = np.argsort(points[:, 0], kind='stable')
+        return np.sort(np.column_stack((order[:-1], order[1:])), axis=1)
+    if n <= d + 1:
+        i, j = np.triu_indices(n, k=1)
+        return np.column_stack((i, j))
+    try:
+        triangulation = Delaunay(points)
+    except QhullError:
+        triangulation = Delaunay(points, qhull_options='QJ')
+
+    # Every pair of corners of a simplex is an edge
+    simplices = triangulation.simplices
+    i, j = np.triu_indices(d + 1, k=1)
+    edges = [simplices[:, [a, b]] for a, b in zip(i, j)]
+    # Duplicate points are left out of the triangulation, tie them to their nearest vertex
+    edges.append(triangulation.coplanar[:, [0, 2]])
+    edges = np.sort(np.concatenate(edges), axis=1)
+    return np.unique(edges, axis=0)
+
+
+def delaunay_graph(points, labels=None):
+    """
+    Delaunay graph of a point set, with O(n) edges in the plane
+
+    Running prim() or kruskal() on it gives the Euclidean MST without
+    building the complete graph.
+
+    Returns:
+        dict: {node: {neighbor: distance}}
+    """
+    points = as_points(points)
+    edges = delaunay_edges(points)
+    return edges_to_graph(len(points), edges, edge_lengths(points, edges), labels)
+
+
+def euclidean_mst(points, labels=None):
+    """
+    Euclidean minimum spanning tree through the Delaunay triangulation
+
+    Kruskal runs on the Delaunay edges only, sorted with NumPy, with the
+    array union-find of the connectivity module.
+
+    Args:
+        points: (n, d) array-like of coordinates
+        labels: Optional node names, one per point
+
+    Returns:
+        dict: {node: {neighbor: distance}}, like kruskal()'s output
+    """
+    points = as_points(points)
+    n = len(points)
+    edges = delaunay_edges(points)
+    lengths = edge_lengths(points, edges)
+    order = np.argsort(lengths, kind='stable')
+
+    parent = list(range(n))
+    chosen = []
+    for e in order.tolist():
+        i, j = edges[e].tolist()
+        root_i = find_root(parent, i)
+        root_j = find_root(parent, j)
+        if root_i != root_j:
+            parent[root_i] = root_j
+            chosen.append(e)
+            if len(chosen) == n - 1:
+                break
+
+    chosen = np.array(chosen, dtype=np.int64)
+    tree = edges_to_graph(n, edges[chosen].reshape(-1, 2), lengths[chosen], labels)
+    # Match kruskal(), which only lists nodes that have a tree edge
+    return {node: neighbors for node, neighbors in tree.items() if neighbors}
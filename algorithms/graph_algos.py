@@ -1,5 +1,7 @@
 from collections import deque
 import heapq
+from algorithms.matching_algos import bipartite_max_flow
+from algorithms.connectivity_algos import prune_unreachable
 
 " Algorithme BFS "
 "  "
@@ -19,6 +21,82 @@ def bfs(graphe, noeud_depart):
 
 
 
+def reverse_graph(graph):
+    """Graph with every edge reversed, as {node: [predecessors]}"""
+    reverse = {node: [] for node in graph}
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            reverse.setdefault(neighbor, []).append(node)
+    return reverse
+
+
+def bidirectional_bfs(graph, source, target, reverse=None, undirected=False):
+    """
+    Bidirectional BFS for s-t reachability and hop distance
+
+    Searches forward from source and backward from target, always expanding
+    the smaller frontier by one full level, and stops as soon as they meet.
+    The backward search needs the reverse graph, built here in O(V + E)
+    unless given. For repeated queries pass reverse=reverse_graph(graph) to
+    build it only once; pass undirected=True when every edge is listed from
+    both ends, so the graph serves as its own reverse.
+
+    Returns:
+        tuple: (hops, path, visited) where hops is float('inf') and path is
+            empty when target is unreachable, and visited counts the nodes
+            discovered by both searches (compare with len(bfs(graph, source)))
+    """
+    if source == target:
+        return 0, [source], 1
+    if reverse is None:
+        reverse = graph if undirected else reverse_graph(graph)
+
+    forward_parent = {source: None}
+    backward_parent = {target: None}
+    forward_frontier = [source]
+    backward_frontier = [target]
+
+    while forward_frontier and backward_frontier:
+        # Expand the smaller side by one level
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, parent, other, adjacency = forward_frontier, forward_parent, backward_parent, graph
+        else:
+            frontier, parent, other, adjacency = backward_frontier, backward_parent, forward_parent, reverse
+
+        next_frontier = []
+        meeting = None
+        for node in frontier:
+            for neighbor in adjacency.get(node, []):
+                if neighbor in parent:
+                    continue
+                parent[neighbor] = node
+                next_frontier.append(neighbor)
+                if neighbor in other and meeting is None:
+                    meeting = neighbor
+        if meeting is not None:
+            break
+        if parent is forward_parent:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+    else:
+        return float('inf'), [], len(forward_parent) + len(backward_parent)
+
+    # Join the two half paths at the meeting node
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = forward_parent[node]
+    path.reverse()
+    node = backward_parent[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward_parent[node]
+
+    return len(path) - 1, path, len(forward_parent) + len(backward_parent)
+
+
 " Algorithme DFS "
 "  "
 def dfs(graphe, noeud_depart, visite=None):
@@ -55,28 +133,55 @@ def coloration_glouton(graphe):
 " Algorithme Welsh-Powell "
 "  "
 def welsh_powell(graphe):
-    # Sort vertices by decreasing degree
-    sommets_tries = sorted(graphe.keys(), key=lambda x: -len(graphe[x]))
+    # Sort vertices by decreasing degree (stable bucket sort)
+    seaux = {}
+    for sommet in graphe:
+        seaux.setdefault(len(graphe[sommet]), []).append(sommet)
+    sommets_tries = [sommet for degre in sorted(seaux, reverse=True) for sommet in seaux[degre]]
+
+    # Vertices that list each vertex as a neighbor
+    voisins_entrants = {sommet: [] for sommet in graphe}
+    for sommet in graphe:
+        for voisin in graphe[sommet]:
+            if voisin in voisins_entrants:
+                voisins_entrants[voisin].append(sommet)
+
+    # Doubly linked list of uncolored vertices for O(1) removal
+    n = len(sommets_tries)
+    suivant = list(range(1, n + 2))
+    precedent = list(range(-1, n + 1))
+
     couleurs = {}
+    bloque = {}  # last color already used by a neighbor
     couleur_disponible = 1
 
-    while sommets_tries:
-        colored_this_round = []
-        for sommet in sommets_tries:
+    while suivant[0] <= n:
+        i = suivant[0]
+        while i <= n:
+            sommet = sommets_tries[i - 1]
+            prochain = suivant[i]
             # Check if any neighbor already has this color
-            if all(couleurs.get(voisin) != couleur_disponible for voisin in graphe[sommet]):
+            if bloque.get(sommet) != couleur_disponible:
                 couleurs[sommet] = couleur_disponible
-                colored_this_round.append(sommet)
-        # Remove colored nodes from the list
-        for sommet in colored_this_round:
-            sommets_tries.remove(sommet)
+                for voisin in voisins_entrants[sommet]:
+                    bloque[voisin] = couleur_disponible
+                # Unlink the colored vertex
+                suivant[precedent[i]] = suivant[i]
+                precedent[suivant[i]] = precedent[i]
+            i = prochain
         couleur_disponible += 1
 
     return couleurs
 
 
-def dijkstra(graph, start):
+def dijkstra(graph, start, prune=False):
     """Dijkstra's shortest path algorithm"""
+    if prune:
+        # Search only the components reachable from the start node
+        distances, previous_nodes = dijkstra(prune_unreachable(graph, start), start)
+        return ({node: distances.get(node, float('inf')) for node in graph},
+                {node: previous_nodes.get(node) for node in graph})
+
     distances = {node: float('inf') for node in graph}
     distances[start] = 0
     previous_nodes = {node: None for node in graph}
@@ -181,8 +286,16 @@ def find(parent, node):
 
 
 
-def bellman_ford(graph, start):
+def bellman_ford(graph, start, prune=False):
     """Bellman-Ford algorithm for shortest paths with negative weights"""
+    if prune:
+        # Relax only the components reachable from the start node
+        distances, predecessors = bellman_ford(prune_unreachable(graph, start), start)
+        if distances is None:
+            return None, None
+        return ({node: distances.get(node, float('inf')) for node in graph},
+                {node: predecessors.get(node) for node in graph})
+
     distances = {node: float('inf') for node in graph}
     predecessors = {node: None for node in graph}
     distances[start] = 0
@@ -224,8 +337,26 @@ def reconstruct_path_bf(predecessors, start, end):
 #ford fulkerson algorithm for maximum flow
 
 
-def ford_fulkerson(graph, source, sink):
+def ford_fulkerson(graph, source, sink, prune=False):
     """Ford-Fulkerson algorithm for maximum flow"""
+    if prune:
+        # Keep only the components on some path from source to sink
+        # The sink is usually only a neighbor, never a key, so only the source
+        # is checked: it stays whenever the sink is reachable from it
+        pruned = prune_unreachable(graph, source, sink)
+        if source in pruned:
+            max_flow, pruned_flow = ford_fulkerson(pruned, source, sink)
+        else:
+            max_flow, pruned_flow = 0, {}
+        flow_network = {u: {v: pruned_flow.get(u, {}).get(v, 0) for v in graph[u]}
+                        for u in graph}
+        return max_flow, flow_network
+
+    # Unit-capacity bipartite networks are matchings, solved with Hopcroft-Karp
+    matching_flow = bipartite_max_flow(graph, source, sink)
+    if matching_flow is not None:
+        return matching_flow
+
     # Create residual graph
     residual = {u: {v: weight for v, weight in neighbors.items()} 
                for u, neighbors in graph.items()}
@@ -0,0 +1,192 @@
+from collections import deque
+
+
+def bipartite_sides(graph):
+    """
+    Split a graph into two sides by BFS 2-coloring
+
+    Edges are treated as undirected, so the graph may list each edge once or
+    in both directions. Neighbors can be given as a list or a dict.
+
+    Returns:
+        tuple: (left, right) sets of nodes, or None if the graph has an odd cycle
+    """
+    # Build the undirected adjacency
+    neighbors = {u: set() for u in graph}
+    for u, adjacent in graph.items():
+        for v in adjacent:
+            neighbors[u].add(v)
+            neighbors.setdefault(v, set()).add(u)
+
+    side = {}
+    for start in neighbors:
+        if start in side:
+            continue
+        side[start] = 0
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v in neighbors[u]:
+                if v not in side:
+                    side[v] = 1 - side[u]
+                    queue.append(v)
+                elif side[v] == side[u]:
+                    return None
+
+    left = {u for u, s in side.items() if s == 0}
+    right = {u for u, s in side.items() if s == 1}
+    return left, right
+
+
+def hopcroft_karp(graph, left=None):
+    """
+    Hopcroft-Karp maximum bipartite matching in O(E * sqrt(V))
+
+    Args:
+        graph: Adjacency as {u: [v, ...]} (or {u: {v: ...}})
+        left: Nodes on the left side. When omitted the sides are found by
+            BFS 2-coloring and a ValueError is raised if the graph is not bipartite
+
+    Returns:
+        dict: Matching as {left_node: right_node}
+    """
+    if left is None:
+        sides = bipartite_sides(graph)
+        if sides is None:
+            raise ValueError("Graph is not bipartite")
+        left = sides[0]
+
+    # Index both sides
+    left_nodes = [u for u in graph if u in left]
+    right_index = {}
+    right_nodes = []
+    adjacency = []
+    for u in left_nodes:
+        row = []
+        for v in graph[u]:
+            if v not in right_index:
+                right_index[v] = len(right_nodes)
+                right_nodes.append(v)
+            row.append(right_index[v])
+        adjacency.append(row)
+
+    n_left = len(left_nodes)
+    match_left = [-1] * n_left
+    match_right = [-1] * len(right_nodes)
+    inf = float('inf')
+    dist = [inf] * n_left
+
+    def bfs_layers():
+        """Layer the free left nodes and report whether a free right node is reachable"""
+        queue = deque()
+        for u in range(n_left):
+            if match_left[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+            else:
+                dist[u] = inf
+        found = False
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                w = match_right[v]
+                if w == -1:
+                    found = True
+                elif dist[w] == inf:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        return found
+
+    def dfs_augment(root, next_edge):
+        """Iterative DFS along the layers, flipping the path when it ends free"""
+        stack = [root]
+        via = []
+        while stack:
+            u = stack[-1]
+            if next_edge[u] < len(adjacency[u]):
+                v = adjacency[u][next_edge[u]]
+                next_edge[u] += 1
+                w = match_right[v]
+                if w == -1:
+                    # Flip the alternating path found on the stack
+                    via.append(v)
+                    for x, y in zip(stack, via):
+                        match_left[x] = y
+                        match_right[y] = x
+                    return True
+                if dist[w] == dist[u] + 1:
+                    stack.append(w)
+                    via.append(v)
+            else:
+                # Dead end, drop the node from the layers
+                dist[u] = inf
+                stack.pop()
+                if via:
+                    via.pop()
+        return False
+
+    while bfs_layers():
+        next_edge = [0] * n_left
+        for u in range(n_left):
+            if match_left[u] == -1:
+                dfs_augment(u, next_edge)
+
+    return {left_nodes[u]: right_nodes[v] for u, v in enumerate(match_left) if v != -1}
+
+
+def unit_bipartite_network(graph, source, sink):
+    """
+    Recognize a unit-capacity source -> left -> right -> sink flow network
+
+    Returns:
+        tuple: (left_adjacency, left) ready for hopcroft_karp, or None when the
+            network does not have that shape
+    """
+    if source == sink or source not in graph:
+        return None
+    if any(capacity != 1 for neighbors in graph.values() for capacity in neighbors.values()):
+        return None
+    if graph.get(sink) or any(source in neighbors for neighbors in graph.values()):
+        return None
+
+    left = set(graph[source])
+    right = {u for u, neighbors in graph.items() if sink in neighbors}
+    if sink in left or left & right:
+        return None
+
+    # Every remaining edge has to go from the left side to the right side
+    left_adjacency = {u: [] for u in graph[source]}
+    for u, neighbors in graph.items():
+        if u == source:
+            continue
+        for v in neighbors:
+            if v == sink:
+                continue
+            if u not in left or v not in right:
+                return None
+            left_adjacency[u].append(v)
+
+    return left_adjacency, left
+
+
+def bipartite_max_flow(graph, source, sink):
+    """
+    Max flow of a unit-capacity bipartite network through Hopcroft-Karp
+
+    Returns:
+        tuple: (max_flow, flow_network) like ford_fulkerson, or None when the
+            network is not a bipartite matching construction
+    """
+    network = unit_bipartite_network(graph, source, sink)
+    if network is None:
+        return None
+    left_adjacency, left = network
+    matching = hopcroft_karp(left_adjacency, left)
+
+    flow_network = {u: {v: 0 for v in graph[u]} for u in graph}
+    for u, v in matching.items():
+        flow_network[source][u] = 1
+        flow_network[u][v] = 1
+        flow_network[v][sink] = 1
+
+    return len(matching), flow_network
@@ -0,0 +1,293 @@
+import numpy as np
+
+from algorithms.graph_algos import kruskal
+
+# Share of changed edges above which DynamicMST.update() rebuilds the forest
+REBUILD_FRACTION = 0.05
+
+
+class BottleneckIndex:
+    """
+    Minimax path queries over a minimum spanning forest
+
+    The largest edge on the MST path between u and v is the smallest
+    possible bottleneck over all u-v paths of the graph. Every tree is rooted
+    and binary lifting tables are kept as NumPy arrays: up[j, v] is the
+    2^j-th ancestor of v and top[j, v] the largest weight on the way there.
+    A query lifts both ends to their LCA in O(log V).
+    """
+
+    def __init__(self, mst):
+        self.nodes = list(mst)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+        parent = np.arange(n)
+        weight = np.full(n, -np.inf)
+        depth = np.zeros(n, dtype=np.int64)
+        tree = np.full(n, -1, dtype=np.int64)
+
+        # Root every tree of the forest with a BFS
+        for root in range(n):
+            if tree[root] != -1:
+                continue
+            tree[root] = root
+            order = [root]
+            for v in order:
+                for neighbor, w in mst[self.nodes[v]].items():
+                    u = self.index[neighbor]
+                    if tree[u] == -1:
+                        tree[u] = root
+                        parent[u] = v
+                        weight[u] = w
+                        depth[u] = depth[v] + 1
+                        order.append(u)
+
+        levels = max(int(depth.max(initial=0)).bit_length(), 1)
+        up = np.empty((levels, n), dtype=np.int64)
+        top = np.empty((levels, n))
+        up[0] = parent
+        top[0] = weight
+        for j in range(1, levels):
+            up[j] = up[j - 1][up[j - 1]]
+            top[j] = np.maximum(top[j - 1], top[j - 1][up[j - 1]])
+
+        self.depth = depth
+        self.tree = tree
+        self.up = up
+        self.top = top
+
+    @classmethod
+    def build(cls, graph):
+        """Index the kruskal() forest of a {node: {neighbor: weight}} graph"""
+        mst = kruskal(graph)
+        # Isolated nodes are not in the kruskal() output
+        for node in graph:
+            mst.setdefault(node, {})
+        return cls(mst)
+
+    def bottleneck(self, u, v):
+        """
+        Largest edge weight on the tree path between u and v
+
+        Returns:
+            float: the minimax weight, -inf when u == v and inf when u and v
+                are in different trees
+        """
+        return float(self.bottlenecks([(u, v)])[0])
+
+    def bottlenecks(self, pairs):
+        """
+        Batched bottleneck queries, lifting all pairs together
+
+        Args:
+            pairs: Iterable of (u, v) node pairs
+
+        Returns:
+            numpy.ndarray: bottleneck weight of each pair
+        """
+        pairs = list(pairs)
+        u = np.array([self.index[a] for a, _ in pairs], dtype=np.int64)
+        v = np.array([self.index[b] for _, b in pairs], dtype=np.int64)
+        best = np.full(len(pairs), -np.inf)
+        connected = self.tree[u] == self.tree[v]
+
+        # Lift the deeper end to the depth of the other one
+        swap = self.depth[u] < self.depth[v]
+        u, v = np.where(swap, v, u), np.where(swap, u, v)
+        diff = self.depth[u] - self.depth[v]
+        for j in range(len(self.up)):
+            step = ((diff >> j) & 1).astype(bool)
+            best = np.where(step, np.maximum(best, self.top[j][u]), best)
+            u = np.where(step, self.up[j][u], u)
+
+        # Lift both ends to just below their lowest common ancestor
+        for j in range(len(self.up) - 1, -1, -1):
+            step = self.up[j][u] != self.up[j][v]
+            best = np.where(step, np.maximum(best, np.maximum(self.top[j][u], self.top[j][v])), best)
+            u = np.where(step, self.up[j][u], u)
+            v = np.where(step, self.up[j][v], v)
+        last = u != v
+        best = np.where(last, np.maximum(best, np.maximum(self.top[0][u], self.top[0][v])), best)
+
+        best[~connected] = np.inf
+        return best
+
+
+def symmetric_graph(graph):
+    """Undirected copy of a {node: {neighbor: weight}} graph, keeping the lighter of two directions"""
+    undirected = {u: {} for u in graph}
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            undirected.setdefault(v, {})
+            if weight < undirected[u].get(v, float('inf')):
+                undirected[u][v] = weight
+                undirected[v][u] = weight
+    return undirected
+
+
+class DynamicMST:
+    """
+    Minimum spanning forest maintained under edge edits
+
+    A new or lighter edge closes a cycle in the forest; by the cycle property
+    it replaces the heaviest tree edge of that cycle when it is lighter. A
+    deleted or heavier tree edge splits its tree in two and the lightest edge
+    across the cut reconnects it. Each edit walks the forest and the edges of
+    the smaller side only, instead of sorting every edge again.
+    """
+
+    def __init__(self, graph):
+        self.build(symmetric_graph(graph))
+
+    def build(self, graph):
+        """Compute the forest from scratch for an undirected graph"""
+        self.graph = graph
+        self.mst = {u: {} for u in self.graph}
+        for u, neighbors in kruskal(self.graph).items():
+            self.mst[u].update(neighbors)
+
+    def add_node(self, u):
+        """Add an isolated node"""
+        self.graph.setdefault(u, {})
+        self.mst.setdefault(u, {})
+
+    def tree_path(self, u, v):
+        """Nodes of the forest path from u to v, or None if they are in different trees"""
+        parent = {u: None}
+        queue = [u]
+        for x in queue:
+            if x == v:
+                break
+            for y in self.mst[x]:
+                if y not in parent:
+                    parent[y] = x
+                    queue.append(y)
+        if v not in parent:
+            return None
+        path = [v]
+        while parent[path[-1]] is not None:
+            path.append(parent[path[-1]])
+        return path
+
+    def link(self, u, v, weight):
+        """Add a forest edge"""
+        self.mst[u][v] = weight
+        self.mst[v][u] = weight
+
+    def cut(self, u, v):
+        """Remove a forest edge"""
+        del self.mst[u][v]
+        del self.mst[v][u]
+
+    def reconnect(self, u, v):
+        """Reconnect the two trees of u and v with the lightest edge across the cut"""
+        # Grow both sides in lockstep and keep the one that finishes first
+        sides = ([u], [v])
+        reached = ({u}, {v})
+        positions = [0, 0]
+        while positions[0] < len(sides[0]) and positions[1] < len(sides[1]):
+            for i in (0, 1):
+                x = sides[i][positions[i]]
+                positions[i] += 1
+                for y in self.mst[x]:
+                    if y not in reached[i]:
+                        reached[i].add(y)
+                        sides[i].append(y)
+        small = reached[0] if positions[0] == len(sides[0]) else reached[1]
+
+        best = None
+        for x in small:
+            for y, weight in self.graph[x].items():
+                if y not in small and (best is None or weight < best[0]):
+                    best = (weight, x, y)
+        if best is not None:
+            self.link(best[1], best[2], best[0])
+
+    def set_weight(self, u, v, weight):
+        """Insert the undirected edge (u, v) or change its weight"""
+        self.add_node(u)
+        self.add_node(v)
+        old = self.graph[u].get(v)
+        self.graph[u][v] = weight
+        self.graph[v][u] = weight
+        if u == v:
+            return
+
+        if v in self.mst[u]:
+            if weight <= old:
+                self.link(u, v, weight)
+            else:
+                self.cut(u, v)
+                self.reconnect(u, v)
+            return
+
+        path = self.tree_path(u, v)
+        if path is None:
+            self.link(u, v, weight)
+            return
+        heaviest = max(zip(path, path[1:]), key=lambda edge: self.mst[edge[0]][edge[1]])
+        if self.mst[heaviest[0]][heaviest[1]] > weight:
+            self.cut(*heaviest)
+            self.link(u, v, weight)
+
+    def remove_edge(self, u, v):
+        """Delete the undirected edge (u, v)"""
+        del self.graph[u][v]
+        self.graph[v].pop(u, None)
+        if v in self.mst[u]:
+            self.cut(u, v)
+            self.reconnect(u, v)
+
+    def remove_node(self, u):
+        """Delete a node and its edges"""
+        for v in list(self.graph[u]):
+            self.remove_edge(u, v)
+        del self.graph[u]
+        del self.mst[u]
+
+    def update(self, graph):
+        """
+        Apply every edge that differs from graph and return the new spanning tree
+
+        Each edit may walk a whole tree, so when nodes come or go, or more
+        than REBUILD_FRACTION of the edges change, the forest is rebuilt
+        with kruskal() instead.
+        """
+        target = symmetric_graph(graph)
+        changed = 0
+        for u, neighbors in target.items():
+            edges = self.graph.get(u, {})
+            changed += sum(1 for v, weight in neighbors.items() if edges.get(v) != weight)
+            changed += sum(1 for v in edges if v not in neighbors)
+        # Every undirected edge was counted from both ends
+        edge_count = sum(len(neighbors) for neighbors in target.values())
+        if target.keys() != self.graph.keys() or changed > REBUILD_FRACTION * edge_count:
+            self.build(target)
+            return self.spanning_tree()
+
+        for u, neighbors in self.graph.items():
+            for v in [v for v in neighbors if v not in target[u]]:
+                self.remove_edge(u, v)
+        for u, neighbors in target.items():
+            for v, weight in neighbors.items():
+                if self.graph[u].get(v) != weight:
+                    self.set_weight(u, v, weight)
+        return self.spanning_tree()
+
+    def spanning_tree(self, root=None):
+        """
+        Current forest as {u: {v: weight}}, like kruskal()'s output
+
+        With a root, only the tree containing it, like prim(graph, root).
+        """
+        if root is None:
+            nodes = self.mst
+        else:
+            nodes = [root]
+            reached = {root}
+            for x in nodes:
+                for y in self.mst[x]:
+                    if y not in reached:
+                        reached.add(y)
+                        nodes.append(y)
+        return {u: dict(self.mst[u]) for u in nodes if self.mst[u]}
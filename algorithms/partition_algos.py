@@ -0,0 +1,321 @@
+import heapq
+import random
+
+import numpy as np
+import scipy.sparse as sp
+
+from algorithms.connectivity_algos import index_digraph
+
+COARSEST_SIZE = 60
+
+
+def weighted_csr(graph):
+    """
+    Symmetric CSR matrix of edge weights, without self loops
+
+    Neighbors may be a list (weight 1) or a {neighbor: weight} dict. An edge
+    listed in both directions keeps the larger of the two weights.
+
+    Returns:
+        tuple: (nodes, csr)
+    """
+    nodes, index, adjacency = index_digraph(graph)
+    n = len(nodes)
+    rows = []
+    cols = []
+    values = []
+    for u, neighbors in graph.items():
+        i = index[u]
+        rows.extend([i] * len(adjacency[i]))
+        cols.extend(adjacency[i])
+        values.extend(neighbors.values() if isinstance(neighbors, dict) else [1.0] * len(neighbors))
+    matrix = sp.csr_matrix((np.array(values, dtype=float), (rows, cols)), shape=(n, n))
+    matrix = matrix.maximum(matrix.T).tolil()
+    matrix.setdiag(0)
+    matrix = matrix.tocsr()
+    matrix.eliminate_zeros()
+    return nodes, matrix
+
+
+def heavy_edge_matching(csr, rng):
+    """
+    Match every vertex with its unmatched neighbor of heaviest edge
+
+    Vertices are visited in random order. Matched pairs (and the vertices
+    left alone) become the vertices of the next coarser level.
+
+    Returns:
+        tuple: (coarse_of, count) where coarse_of maps each vertex to its
+            coarse vertex id
+    """
+    n = csr.shape[0]
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    data = csr.data.tolist()
+    coarse_of = [-1] * n
+    count = 0
+    order = list(range(n))
+    rng.shuffle(order)
+    for v in order:
+        if coarse_of[v] != -1:
+            continue
+        best = -1
+        best_weight = 0
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if coarse_of[u] == -1 and u != v and data[k] > best_weight:
+                best = u
+                best_weight = data[k]
+        coarse_of[v] = count
+        if best != -1:
+            coarse_of[best] = count
+        count += 1
+    return np.array(coarse_of, dtype=np.int64), count
+
+
+def contract(csr, vertex_weight, coarse_of, count):
+    """Coarse graph where matched vertices are merged and parallel edges summed"""
+    n = csr.shape[0]
+    projection = sp.csr_matrix((np.ones(n), (np.arange(n), coarse_of)), shape=(n, count))
+    coarse = (projection.T @ csr @ projection).tolil()
+    coarse.setdiag(0)
+    coarse = coarse.tocsr()
+    coarse.eliminate_zeros()
+    return coarse, np.bincount(coarse_of, weights=vertex_weight, minlength=count)
+
+
+def greedy_bisection(csr, vertex_weight, target, rng, tries=4):
+    """
+    Greedy graph growing bisection
+
+    Side 0 grows from a random seed, always taking the frontier vertex with
+    the best cut gain, until it weighs target. The best of a few seeds wins.
+
+    Returns:
+        numpy.ndarray: side (0 or 1) of each vertex
+    """
+    n = csr.shape[0]
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    data = csr.data.tolist()
+    degree = np.asarray(csr.sum(axis=1)).ravel().tolist()
+    best_side = None
+    best_cut = float('inf')
+
+    for _ in range(tries):
+        side = [1] * n
+        connection = [0.0] * n
+        weight = 0.0
+        start = rng.randrange(n)
+        heap = [(degree[start], start)]
+        while weight < target:
+            if not heap:
+                # Disconnected graph, restart from an unused vertex
+                rest = [v for v in range(n) if side[v] == 1]
+                if not rest:
+                    break
+                v = rng.choice(rest)
+                heap = [(degree[v] - 2 * connection[v], v)]
+            gain, v = heapq.heappop(heap)
+            if side[v] == 0 or gain != degree[v] - 2 * connection[v]:
+                continue
+            side[v] = 0
+            weight += vertex_weight[v]
+            for k in range(indptr[v], indptr[v + 1]):
+                u = indices[k]
+                if side[u] == 1:
+                    connection[u] += data[k]
+                    # Lower is better: moving u removes its edges to side 0 from the cut
+                    heapq.heappush(heap, (degree[u] - 2 * connection[u], u))
+
+        side = np.array(side, dtype=np.int64)
+        cut = cut_weight(csr, side)
+        if cut < best_cut:
+            best_cut = cut
+            best_side = side
+    return best_side
+
+
+def cut_weight(csr, part):
+    """Total weight of the edges between different parts"""
+    coo = csr.tocoo()
+    return float(coo.data[part[coo.row] != part[coo.col]].sum()) / 2
+
+
+def fm_refine(csr, vertex_weight, side, low, high, max_passes=8):
+    """
+    Fiduccia-Mattheyses refinement of a bisection
+
+    Each pass moves unlocked vertices one at a time, best gain first, as long
+    as side 0 stays within [low, high] (or moves toward it), then rolls back
+    to the best balanced prefix of moves. Gains live in lazy heaps.
+
+    Returns:
+        numpy.ndarray: the refined side of each vertex
+    """
+    n = csr.shape[0]
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    data = csr.data.tolist()
+    weights = vertex_weight.tolist()
+    side = side.tolist()
+    weight0 = sum(w for w, s in zip(weights, side) if s == 0)
+
+    for _ in range(max_passes):
+        # Gain of moving v: external minus internal edge weight
+        gain = [0.0] * n
+        for v in range(n):
+            for k in range(indptr[v], indptr[v + 1]):
+                gain[v] += data[k] if side[indices[k]] != side[v] else -data[k]
+        heaps = ([], [])
+        for v in range(n):
+            heaps[side[v]].append((-gain[v], v))
+        heapq.heapify(heaps[0])
+        heapq.heapify(heaps[1])
+
+        locked = [False] * n
+        moves = []
+        total = 0.0
+        balanced = low <= weight0 <= high
+        best = (balanced, 0.0)
+        best_length = 0
+        stall = 0
+
+        while stall < max(50, n // 20):
+            # Candidate from each side, skipping stale entries
+            candidates = []
+            for s in (0, 1):
+                heap = heaps[s]
+                while heap and (locked[heap[0][1]] or side[heap[0][1]] != s or -heap[0][0] != gain[heap[0][1]]):
+                    heapq.heappop(heap)
+                if heap:
+                    v = heap[0][1]
+                    after = weight0 - weights[v] if s == 0 else weight0 + weights[v]
+                    if low <= after <= high or abs(after - (low + high) / 2) < abs(weight0 - (low + high) / 2):
+                        candidates.append((gain[v], s, v))
+            if not candidates:
+                break
+            g, s, v = max(candidates)
+            heapq.heappop(heaps[s])
+
+            locked[v] = True
+            side[v] = 1 - s
+            weight0 += weights[v] if s == 1 else -weights[v]
+            total += g
+            moves.append(v)
+            for k in range(indptr[v], indptr[v + 1]):
+                u = indices[k]
+                gain[u] += 2 * data[k] if side[u] == s else -2 * data[k]
+                if not locked[u]:
+                    heapq.heappush(heaps[side[u]], (-gain[u], u))
+
+            key = (low <= weight0 <= high, total)
+            if key > best:
+                best = key
+                best_length = len(moves)
+                stall = 0
+            else:
+                stall += 1
+
+        # Undo the moves after the best prefix
+        for v in moves[best_length:]:
+            weight0 += weights[v] if side[v] == 1 else -weights[v]
+            side[v] = 1 - side[v]
+        if best_length == 0 or best[1] <= 0 and best[0] == balanced:
+            break
+
+    return np.array(side, dtype=np.int64)
+
+
+def multilevel_bisection(csr, vertex_weight, fraction, imbalance, rng):
+    """
+    Multilevel bisection: coarsen, bisect the coarsest graph, refine upward
+
+    Args:
+        fraction: Target share of the vertex weight on side 0
+        imbalance: Allowed relative deviation from the target weight of the
+            lighter side
+
+    Returns:
+        numpy.ndarray: side (0 or 1) of each vertex
+    """
+    total = vertex_weight.sum()
+    target = fraction * total
+    slack = imbalance * total * min(fraction, 1 - fraction)
+
+    # Coarsen while matching still shrinks the graph
+    levels = []
+    graph, weights = csr, vertex_weight
+    while graph.shape[0] > COARSEST_SIZE:
+        coarse_of, count = heavy_edge_matching(graph, rng)
+        if count > 0.9 * graph.shape[0]:
+            break
+        levels.append((graph, weights, coarse_of))
+        graph, weights = contract(graph, weights, coarse_of, count)
+
+    # Coarse vertices are heavy, so allow one of them as slack at each level
+    side = greedy_bisection(graph, weights, target, rng)
+    side = fm_refine(graph, weights, side, target - max(slack, weights.max()), target + max(slack, weights.max()))
+    for graph, weights, coarse_of in reversed(levels):
+        side = side[coarse_of]
+        room = max(slack, weights.max())
+        side = fm_refine(graph, weights, side, target - room, target + room)
+    return side
+
+
+def partition_graph(graph, k, imbalance=0.03, seed=None):
+    """
+    Balanced k-way partition with a small edge cut
+
+    Multilevel recursive bisection: heavy-edge matching coarsening, greedy
+    graph growing on the coarsest graph and Fiduccia-Mattheyses refinement
+    at every level on the way back.
+
+    Args:
+        graph: Graph as {node: [neighbors]} or {node: {neighbor: weight}},
+            treated as undirected
+        k: Number of parts
+        imbalance: Allowed relative deviation of each bisection
+        seed: Seed for the matchings and the growing seeds
+
+    Returns:
+        dict: Result containing:
+            - 'partition': {node: part id in 0..k-1}
+            - 'edge_cut': total weight of the edges between parts
+            - 'cut_edges': number of edges between parts
+            - 'part_sizes': number of nodes in each part
+            - 'imbalance': largest part size over the average part size
+    """
+    if k < 1:
+        raise ValueError("Number of parts must be at least 1")
+    rng = random.Random(seed)
+    nodes, csr = weighted_csr(graph)
+    n = len(nodes)
+    part = np.zeros(n, dtype=np.int64)
+
+    # Split (vertices, parts, first id) ranges until each holds one part
+    stack = [(np.arange(n), k, 0)]
+    while stack:
+        vertices, parts, first = stack.pop()
+        if parts == 1 or len(vertices) == 0:
+            part[vertices] = first
+            continue
+        half = parts // 2
+        if len(vertices) == 1:
+            part[vertices] = first
+            continue
+        sub = csr[vertices][:, vertices]
+        side = multilevel_bisection(sub, np.ones(len(vertices)), half / parts, imbalance, rng)
+        stack.append((vertices[side == 0], half, first))
+        stack.append((vertices[side == 1], parts - half, first + half))
+
+    coo = sp.triu(csr).tocoo()
+    crossing = part[coo.row] != part[coo.col]
+    sizes = np.bincount(part, minlength=k)
+    return {
+        'partition': dict(zip(nodes, part.tolist())),
+        'edge_cut': float(coo.data[crossing].sum()),
+        'cut_edges': int(crossing.sum()),
+        'part_sizes': sizes.tolist(),
+        'imbalance': float(sizes.max() * k / n) if n else 0.0,
+    }
@@ -0,0 +1,314 @@
+import heapq
+from itertools import count
+
+
+def tree_to_target(graph, target):
+    """
+    Shortest path tree towards target, by Dijkstra on the reversed graph
+
+    Returns:
+        tuple: (dist_to, next_hop) where dist_to[v] is the distance from v to
+            target and next_hop[v] the successor of v on that shortest path
+    """
+    reverse = {}
+    for u, neighbors in graph.items():
+        for v, weight in neighbors.items():
+            reverse.setdefault(v, {})[u] = weight
+
+    dist_to = {target: 0}
+    next_hop = {target: None}
+    priority_queue = [(0, target)]
+    while priority_queue:
+        d, v = heapq.heappop(priority_queue)
+        if d > dist_to[v]:
+            continue
+        for u, weight in reverse.get(v, {}).items():
+            distance = d + weight
+            if distance < dist_to.get(u, float('inf')):
+                dist_to[u] = distance
+                next_hop[u] = v
+                heapq.heappush(priority_queue, (distance, u))
+    return dist_to, next_hop
+
+
+def tree_path(next_hop, v):
+    """Follow the shortest path tree from v to its root"""
+    path = [v]
+    while next_hop[path[-1]] is not None:
+        path.append(next_hop[path[-1]])
+    return path
+
+
+def spur_search(graph, spur, target, blocked_nodes, blocked_next, dist_to, bound):
+    """
+    A* from spur to target avoiding blocked nodes and the blocked first hops
+
+    Distances to target in the full graph never overestimate once nodes and
+    edges are removed, so they serve as the heuristic. The search gives up as
+    soon as the best estimate exceeds bound.
+
+    Returns:
+        tuple: (cost, path), or None when no path within bound exists
+    """
+    distances = {spur: 0}
+    previous = {spur: None}
+    priority_queue = [(dist_to[spur], 0, spur)]
+    while priority_queue:
+        estimate, d, v = heapq.heappop(priority_queue)
+        if estimate > bound:
+            return None
+        if v == target:
+            path = [v]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            return d, path[::-1]
+        if d > distances[v]:
+            continue
+        for w, weight in graph.get(v, {}).items():
+            if w in blocked_nodes or w not in dist_to or (v == spur and w in blocked_next):
+                continue
+            distance = d + weight
+            if distance < distances.get(w, float('inf')):
+                distances[w] = distance
+                previous[w] = v
+                heapq.heappush(priority_queue, (distance + dist_to[w], distance, w))
+    return None
+
+
+def k_shortest_paths(graph, start, end, k):
+    """
+    Yen's k shortest loopless paths
+
+    The shortest path tree towards end is computed once. A spur path that can
+    simply follow this tree is taken from it without any search; the others
+    run an A* guided by the tree distances, cut off once they cannot beat the
+    candidates already waiting in the heap.
+
+    Args:
+        graph: Weighted graph as {node: {neighbor: weight}}, like dijkstra()
+        start: Start node
+        end: End node
+        k: Number of paths
+
+    Returns:
+        list: up to k (cost, path) pairs by increasing cost
+    """
+    dist_to, next_hop = tree_to_target(graph, end)
+    if start not in dist_to or k < 1:
+        return []
+
+    accepted = [(dist_to[start], tree_path(next_hop, start))]
+    candidates = []
+    seen = {tuple(accepted[0][1])}
+    tie = count()
+
+    while len(accepted) < k:
+        _, last = accepted[-1]
+
+        # Candidates past the number still needed can never be accepted
+        needed = k - len(accepted)
+        if len(candidates) >= needed:
+            bound = heapq.nsmallest(needed, candidates)[-1][0]
+        else:
+            bound = float('inf')
+
+        root_cost = 0
+        for i in range(len(last) - 1):
+            spur = last[i]
+            root = last[:i + 1]
+            blocked_nodes = set(root[:-1])
+            blocked_next = {path[i + 1] for _, path in accepted if path[:i + 1] == root}
+
+            # Spur path cached in the tree when its first hop and nodes are still free
+            cached = tree_path(next_hop, spur)
+            if len(cached) > 1 and cached[1] not in blocked_next and blocked_nodes.isdisjoint(cached):
+                spur_cost, spur_path = dist_to[spur], cached
+            else:
+                result = spur_search(graph, spur, end, blocked_nodes, blocked_next,
+                                     dist_to, bound - root_cost)
+                if result is None:
+                    root_cost += graph[spur][last[i + 1]]
+                    continue
+                spur_cost, spur_path = result
+
+            path = root[:-1] + spur_path
+            if tuple(path) not in seen:
+                seen.add(tuple(path))
+                heapq.heappush(candidates, (root_cost + spur_cost, next(tie), path))
+            root_cost += graph[spur][last[i + 1]]
+
+        if not candidates:
+            break
+        cost, _, path = heapq.heappop(candidates)
+        accepted.append((cost, path))
+
+    return accepted
+
+
+class DynamicShortestPaths:
+    """
+    Single-source shortest paths repaired after edge updates (Ramalingam-Reps)
+
+    Distances and the predecessor tree are kept between updates. A heavier
+    or deleted tree edge invalidates only the subtree below it: those nodes
+    are reset and re-seeded from their unaffected in-neighbors. A lighter or
+    new edge that improves its head is seeded directly. A Dijkstra restricted
+    to the seeded nodes then propagates the changes, so untouched parts of
+    the graph are never visited.
+
+    touched counts the nodes reset or relaxed by the last update and
+    total_touched accumulates it over the lifetime of the object.
+    """
+
+    def __init__(self, graph, source):
+        self.source = source
+        self.graph = {}
+        self.incoming = {}
+        self.distances = {}
+        self.previous = {}
+        self.children = {}
+        for u, neighbors in graph.items():
+            self.add_node(u)
+            for v, weight in neighbors.items():
+                self.add_node(v)
+                self.check_weight(weight)
+                self.graph[u][v] = weight
+                self.incoming[v][u] = weight
+
+        self.add_node(source)
+        self.distances[source] = 0
+        self.touched = 0
+        self.total_touched = 0
+        self.propagate([(0, source)])
+
+    @staticmethod
+    def check_weight(weight):
+        """Dijkstra repairs need non-negative weights"""
+        if weight < 0:
+            raise ValueError(f"Negative edge weight {weight} is not supported")
+
+    def add_node(self, u):
+        """Add an isolated, unreachable node"""
+        if u not in self.graph:
+            self.graph[u] = {}
+            self.incoming[u] = {}
+            self.distances[u] = float('inf')
+            self.previous[u] = None
+            self.children[u] = set()
+
+    def set_parent(self, v, u):
+        """Move v under u in the predecessor tree"""
+        if self.previous[v] is not None:
+            self.children[self.previous[v]].discard(v)
+        self.previous[v] = u
+        if u is not None:
+            self.children[u].add(v)
+
+    def propagate(self, seeds):
+        """Dijkstra from the seeded (distance, node) pairs, counting relaxed nodes"""
+        priority_queue = list(seeds)
+        heapq.heapify(priority_queue)
+        while priority_queue:
+            d, u = heapq.heappop(priority_queue)
+            if d > self.distances[u]:
+                continue
+            for v, weight in self.graph[u].items():
+                distance = d + weight
+                if distance < self.distances[v]:
+                    self.distances[v] = distance
+                    self.set_parent(v, u)
+                    self.touched += 1
+                    heapq.heappush(priority_queue, (distance, v))
+
+    def update(self, changes):
+        """
+        Apply a batch of edge updates and repair the shortest paths
+
+        Args:
+            changes: Iterable of (u, v, weight) triples; a weight of None
+                deletes the edge
+
+        Returns:
+            int: number of nodes touched by the repair
+        """
+        self.touched = 0
+        original = {}
+        for u, v, weight in changes:
+            self.add_node(u)
+            self.add_node(v)
+            original.setdefault((u, v), self.graph[u].get(v))
+            if weight is None:
+                self.graph[u].pop(v, None)
+                self.incoming[v].pop(u, None)
+            else:
+                self.check_weight(weight)
+                self.graph[u][v] = weight
+                self.incoming[v][u] = weight
+
+        # Classify the net change of every edge in the batch
+        roots = []
+        improved = []
+        for (u, v), old in original.items():
+            weight = self.graph[u].get(v)
+            if weight == old:
+                continue
+            if self.previous[v] == u and (weight is None or weight > old):
+                roots.append(v)
+            elif weight is not None and (old is None or weight < old):
+                improved.append((u, v))
+
+        # Reset every subtree hanging below a heavier or deleted tree edge
+        affected = []
+        reached = set()
+        for root in roots:
+            if root in reached:
+                continue
+            reached.add(root)
+            stack = [root]
+            while stack:
+                x = stack.pop()
+                affected.append(x)
+                for y in self.children[x]:
+                    if y not in reached:
+                        reached.add(y)
+                        stack.append(y)
+        for x in affected:
+            self.distances[x] = float('inf')
+            self.set_parent(x, None)
+        self.touched += len(affected)
+
+        # Seed the reset nodes from their unaffected in-neighbors
+        seeds = []
+        for x in affected:
+            for u, weight in self.incoming[x].items():
+                distance = self.distances[u] + weight
+                if distance < self.distances[x]:
+                    self.distances[x] = distance
+                    self.set_parent(x, u)
+            if self.distances[x] < float('inf'):
+                seeds.append((self.distances[x], x))
+
+        # Seed the heads of lighter or new edges that now give a shorter path
+        for u, v in improved:
+            distance = self.distances[u] + self.graph[u][v]
+            if distance < self.distances[v]:
+                self.distances[v] = distance
+                self.set_parent(v, u)
+                self.touched += 1
+                seeds.append((distance, v))
+
+        self.propagate(seeds)
+        self.total_touched += self.touched
+        return self.touched
+
+    def set_weight(self, u, v, weight):
+        """Insert the edge (u, v) or change its weight"""
+        return self.update([(u, v, weight)])
+
+    def remove_edge(self, u, v):
+        """Delete the edge (u, v)"""
+        return self.update([(u, v, None)])
+
+    def result(self):
+        """Current (distances, previous_nodes), like dijkstra()'s output"""
+        return dict(self.distances), dict(self.previous)
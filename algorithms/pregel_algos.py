@@ -0,0 +1,330 @@
+import multiprocessing
+import operator
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from algorithms.centrality_algos import index_weighted
+from algorithms.partition_algos import partition_graph
+
+# Combiner name: (scalar combine, NumPy reduction, identity)
+COMBINERS = {
+    'min': (min, np.minimum, np.inf),
+    'max': (max, np.maximum, -np.inf),
+    'sum': (operator.add, np.add, 0.0),
+}
+
+
+class BFSProgram:
+    """Hop level from source; unreached vertices keep inf"""
+
+    combiner = 'min'
+
+    def __init__(self, source):
+        self.source = source
+
+    def initial(self, v):
+        return 0.0 if v == self.source else np.inf
+
+    def compute(self, superstep, v, value, message, neighbors, weights, send):
+        if message is not None and message < value:
+            value = message
+        elif not (superstep == 0 and v == self.source):
+            return value, True
+        for u in neighbors:
+            send(u, value + 1)
+        return value, True
+
+
+class SSSPProgram:
+    """Shortest path distance from source, relaxed superstep by superstep"""
+
+    combiner = 'min'
+
+    def __init__(self, source):
+        self.source = source
+
+    def initial(self, v):
+        return 0.0 if v == self.source else np.inf
+
+    def compute(self, superstep, v, value, message, neighbors, weights, send):
+        if message is not None and message < value:
+            value = message
+        elif not (superstep == 0 and v == self.source):
+            return value, True
+        for u, weight in zip(neighbors, weights):
+            send(u, value + weight)
+        return value, True
+
+
+class ComponentsProgram:
+    """Smallest vertex id of the component, spread by label propagation"""
+
+    combiner = 'min'
+
+    def initial(self, v):
+        return float(v)
+
+    def compute(self, superstep, v, value, message, neighbors, weights, send):
+        if message is not None and message < value:
+            value = message
+        elif superstep > 0:
+            return value, True
+        for u in neighbors:
+            send(u, value)
+        return value, True
+
+
+class PageRankProgram:
+    """
+    PageRank for a fixed number of supersteps
+
+    As in the original Pregel program, the rank of vertices without
+    out-edges is not redistributed, so scores only match pagerank() on
+    graphs without dangling vertices.
+    """
+
+    combiner = 'sum'
+
+    def __init__(self, n, alpha=0.85, iterations=30):
+        self.n = n
+        self.alpha = alpha
+        self.iterations = iterations
+
+    def initial(self, v):
+        return 1.0 / self.n
+
+    def compute(self, superstep, v, value, message, neighbors, weights, send):
+        if superstep > 0:
+            value = (1 - self.alpha) / self.n + self.alpha * (message or 0.0)
+        if superstep < self.iterations:
+            if neighbors:
+                share = value / len(neighbors)
+                for u in neighbors:
+                    send(u, share)
+            return value, False
+        return value, True
+
+
+def run_partition(rank, own, adjacency, weights, program, buffers, barrier, max_supersteps):
+    """
+    Superstep loop of one worker over the vertices it owns
+
+    Each worker combines its outgoing messages into its own row of the
+    outbox, so no two workers ever write the same slot. After the first
+    barrier every worker reduces the column of each vertex it owns into its
+    inbox; after the second one the next superstep starts. The active
+    counters are double buffered so they can be read right after the
+    barrier while the next superstep already writes the other half.
+
+    Returns:
+        int: number of supersteps run
+    """
+    values, inbox, has_message, outbox, sent, active = buffers
+    combine, reduce, identity = COMBINERS[program.combiner]
+    own_index = np.array(own, dtype=np.int64)
+    halted = {v: False for v in own}
+    for v in own:
+        values[v] = program.initial(v)
+
+    superstep = 0
+    while superstep < max_supersteps:
+        outgoing = {}
+
+        def send(u, message):
+            outgoing[u] = combine(outgoing[u], message) if u in outgoing else message
+
+        running = 0
+        delivered = has_message[own_index].tolist()
+        messages = inbox[own_index].tolist()
+        for v, has, message in zip(own, delivered, messages):
+            if halted[v] and not has:
+                continue
+            value, halt = program.compute(superstep, v, float(values[v]), message if has else None,
+                                          adjacency[v], weights[v], send)
+            values[v] = value
+            halted[v] = halt
+            running += not halt
+
+        outbox[rank].fill(identity)
+        sent[rank].fill(0)
+        if outgoing:
+            targets = np.fromiter(outgoing.keys(), dtype=np.int64, count=len(outgoing))
+            outbox[rank, targets] = np.fromiter(outgoing.values(), dtype=float, count=len(outgoing))
+            sent[rank, targets] = 1
+        active[superstep % 2, rank] = running + len(outgoing)
+        barrier.wait()
+
+        # Deliver the combined messages of every worker to the owned vertices
+        inbox[own_index] = reduce.reduce(outbox[:, own_index], axis=0)
+        has_message[own_index] = sent[:, own_index].any(axis=0)
+        barrier.wait()
+
+        superstep += 1
+        if active[(superstep - 1) % 2].sum() == 0:
+            break
+    return superstep
+
+
+BUFFER_LAYOUT = [('values', float, 'n'), ('inbox', float, 'n'), ('has_message', np.uint8, 'n'),
+                 ('outbox', float, 'wn'), ('sent', np.uint8, 'wn'), ('active', np.int64, '2w')]
+
+
+def buffer_shape(kind, n, workers):
+    return {'n': (n,), 'wn': (workers, n), '2w': (2, workers)}[kind]
+
+
+def bsp_process(rank, own, adjacency, weights, program, names, n, workers, barrier, max_supersteps, result):
+    """Worker process entry: attach the shared buffers and run the superstep loop"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        buffers = [np.ndarray(buffer_shape(kind, n, workers), dtype=dtype, buffer=block.buf)
+                   for (_, dtype, kind), block in zip(BUFFER_LAYOUT, blocks)]
+        try:
+            supersteps = run_partition(rank, own, adjacency, weights, program, buffers,
+                                       barrier, max_supersteps)
+        except threading.BrokenBarrierError:
+            return
+        except BaseException:
+            # Release the other workers waiting at the barrier
+            barrier.abort()
+            raise
+        if rank == 0:
+            result.value = supersteps
+        del buffers
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def run_pregel(graph, program, workers=None, partition=None, max_supersteps=1000):
+    """
+    Run a vertex program with bulk-synchronous supersteps
+
+    Vertices are split among worker processes. Messages travel through
+    shared-memory buffers and are always reduced with the program's
+    combiner ('min', 'max' or 'sum'), so each vertex receives at most one
+    value per superstep. The run stops when every vertex has voted to halt
+    and no message is in flight.
+
+    Args:
+        graph: Directed graph as {node: [neighbors]} or {node: {neighbor: weight}}
+        program: Vertex program with combiner, initial(v) and
+            compute(superstep, v, value, message, neighbors, weights, send)
+            returning (value, halt); vertices are given as integer ids
+        workers: Number of processes. None or 1 stays in this process
+        partition: Optional {node: worker}; by default partition_graph()
+            balances the vertices and keeps the edge cut small
+        max_supersteps: Upper bound on the number of supersteps
+
+    Returns:
+        tuple: ({node: value}, supersteps)
+    """
+    nodes, adjacency, weights = index_weighted(graph)
+    n = len(nodes)
+    if weights is None:
+        weights = [[1] * len(neighbors) for neighbors in adjacency]
+    if program.combiner not in COMBINERS:
+        raise ValueError(f"Unknown combiner {program.combiner!r}")
+    workers = 1 if workers is None else max(1, min(workers, n))
+
+    if workers == 1:
+        buffers = [np.zeros(buffer_shape(kind, n, 1), dtype=dtype) for _, dtype, kind in BUFFER_LAYOUT]
+        own = list(range(n))
+        supersteps = run_partition(0, own, adjacency, weights, program, buffers,
+                                   threading.Barrier(1), max_supersteps)
+        return dict(zip(nodes, buffers[0].tolist())), supersteps
+
+    if partition is None:
+        partition = partition_graph(graph, workers)['partition']
+    owner = [partition[node] for node in nodes]
+    owned = [[] for _ in range(workers)]
+    for v, w in enumerate(owner):
+        owned[w].append(v)
+
+    blocks = []
+    try:
+        for _, dtype, kind in BUFFER_LAYOUT:
+            size = int(np.prod(buffer_shape(kind, n, workers))) * np.dtype(dtype).itemsize
+            blocks.append(shared_memory.SharedMemory(create=True, size=max(size, 1)))
+        names = [block.name for block in blocks]
+        barrier = multiprocessing.Barrier(workers)
+        result = multiprocessing.Value('q', 0)
+        processes = []
+        for rank in range(workers):
+            own = owned[rank]
+            process = multiprocessing.Process(
+                target=bsp_process,
+                args=(rank, own, {v: adjacency[v] for v in own}, {v: weights[v] for v in own},
+                      program, names, n, workers, barrier, max_supersteps, result))
+            process.start()
+            processes.append(process)
+        for process in processes:
+            process.join()
+        if any(process.exitcode != 0 for process in processes):
+            raise RuntimeError("A BSP worker process failed")
+
+        values = np.ndarray((n,), dtype=float, buffer=blocks[0].buf).tolist()
+        return dict(zip(nodes, values)), result.value
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def pregel_bfs(graph, start, workers=None):
+    """
+    Hop levels from start, on the same nodes bfs() reaches
+
+    Returns:
+        dict: {node: level} for the reached nodes
+    """
+    if start not in graph:
+        return {start: 0}
+    levels, _ = run_pregel(graph, BFSProgram(list(graph).index(start)), workers)
+    return {node: int(level) for node, level in levels.items() if level != np.inf}
+
+
+def pregel_sssp(graph, start, workers=None):
+    """
+    Shortest path distances from start, like the distances of dijkstra()
+
+    Returns:
+        dict: {node: distance}, inf for unreachable nodes
+    """
+    if start not in graph:
+        raise ValueError(f"Start node {start!r} is not in the graph")
+    distances, _ = run_pregel(graph, SSSPProgram(list(graph).index(start)), workers)
+    return {node: distances[node] for node in graph}
+
+
+def pregel_components(graph, workers=None):
+    """
+    Weakly connected components by label propagation
+
+    Returns:
+        list: components as lists of nodes
+    """
+    undirected = {u: list(neighbors) for u, neighbors in graph.items()}
+    for u, neighbors in graph.items():
+        for v in neighbors:
+            undirected.setdefault(v, []).append(u)
+    labels, _ = run_pregel(undirected, ComponentsProgram(), workers)
+    components = {}
+    for node, label in labels.items():
+        components.setdefault(label, []).append(node)
+    return list(components.values())
+
+
+def pregel_pagerank(graph, alpha=0.85, iterations=30, workers=None):
+    """
+    PageRank with a fixed number of supersteps
+
+    Returns:
+        dict: {node: score}
+    """
+    nodes, _, _ = index_weighted(graph)
+    scores, _ = run_pregel(graph, PageRankProgram(len(nodes), alpha, iterations), workers,
+                           max_supersteps=iterations + 1)
+    return scores
@@ -0,0 +1,98 @@
+import ast
+import random
+
+import numpy as np
+
+from algorithms.connectivity_algos import index_digraph, tarjan_scc
+from algorithms.graph_algos import bfs
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure index answering reach(s, t) in O(1)
+
+    Nodes are collapsed to their strongly connected components and each
+    component keeps a bitset row (NumPy uint64 words) of the components it
+    can reach. Components are numbered in topological order, so the rows
+    are filled from the last component back to the first by OR-ing the rows
+    of the successors. Memory is one bit per pair of components.
+    """
+
+    def __init__(self, nodes, component, rows):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.component = component
+        self.rows = rows
+
+    @classmethod
+    def build(cls, graph, validate=0, seed=None):
+        """
+        Build the index for a directed {node: neighbors} graph
+
+        Args:
+            graph: Graph as {node: [neighbors]} or {node: {neighbor: weight}}
+            validate: Number of sampled sources whose rows are checked against bfs()
+            seed: Seed for the validation sample
+        """
+        nodes, _, adjacency = index_digraph(graph)
+        component = tarjan_scc(adjacency)
+        count = max(component, default=-1) + 1
+        words = (count + 63) // 64
+
+        # Successor components of each component
+        successors = [set() for _ in range(count)]
+        for v, c in enumerate(component):
+            for w in adjacency[v]:
+                if component[w] != c:
+                    successors[c].add(component[w])
+
+        # Later components are finished first, thanks to the topological numbering
+        rows = np.zeros((count, words), dtype=np.uint64)
+        for c in range(count - 1, -1, -1):
+            row = rows[c]
+            row[c >> 6] |= np.uint64(1 << (c & 63))
+            for d in successors[c]:
+                row |= rows[d]
+
+        index = cls(nodes, np.array(component, dtype=np.int64), rows)
+        if validate:
+            index.validate(graph, validate, seed)
+        return index
+
+    def reaches(self, source, target):
+        """Whether target is reached from source, with bfs() semantics"""
+        if source not in self.index or target not in self.index:
+            return source == target
+        cs = self.component[self.index[source]]
+        ct = self.component[self.index[target]]
+        return bool((int(self.rows[cs, ct >> 6]) >> int(ct & 63)) & 1)
+
+    def reachable_from(self, source):
+        """All nodes reached from source"""
+        if source not in self.index:
+            return [source]
+        words = self.rows[self.component[self.index[source]]].astype('<u8')
+        row = np.unpackbits(words.view(np.uint8), bitorder='little')
+        return [node for node, c in zip(self.nodes, self.component) if row[c]]
+
+    def validate(self, graph, samples=10, seed=None):
+        """Compare the rows of sampled sources with bfs() and raise ValueError on mismatch"""
+        rng = random.Random(seed)
+        sources = rng.sample(list(graph), min(samples, len(graph)))
+        for source in sources:
+            reached = set(bfs(graph, source))
+            for target in self.nodes:
+                if self.reaches(source, target) != (target in reached):
+                    raise ValueError(f"Reachability index disagrees with bfs() for {source!r} -> {target!r}")
+
+    def save(self, path):
+        """Write the index to a .npz file"""
+        np.savez_compressed(path, nodes=np.array(repr(self.nodes)),
+                            component=self.component, rows=self.rows)
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save()"""
+        with np.load(path) as data:
+            nodes = ast.literal_eval(str(data['nodes']))
+            return cls(nodes, data['component'], data['rows'])
@@ -0,0 +1,188 @@
+import numpy as np
+
+from algorithms.coloring_algos import degeneracy_order, index_graph
+from algorithms.connectivity_algos import find_root
+
+
+def core_numbers(graph):
+    """
+    k-core decomposition by Batagelj-Zaversnik bucket peeling in O(V + E)
+
+    Args:
+        graph: Graph as {node: [neighbors]}, treated as undirected
+
+    Returns:
+        dict: {node: core number}
+    """
+    nodes, adjacency = index_graph(graph)
+    _, core = degeneracy_order(adjacency)
+    return dict(zip(nodes, core))
+
+
+def triangle_count(graph):
+    """
+    Triangle counting on the degree-ordered forward adjacency
+
+    Every edge is kept only from its lower ranked end (rank by degree, then
+    index), so each triangle is found exactly once, by intersecting the
+    sorted NumPy neighbor arrays of the two ends of its lowest edge.
+
+    Args:
+        graph: Graph as {node: [neighbors]}, treated as undirected
+
+    Returns:
+        tuple: (total, per_node) with the number of triangles and
+            {node: number of triangles through the node}
+    """
+    nodes, adjacency = index_graph(graph)
+    n = len(nodes)
+    degree = [len(neighbors) for neighbors in adjacency]
+    rank = [0] * n
+    for position, v in enumerate(sorted(range(n), key=lambda v: (degree[v], v))):
+        rank[v] = position
+
+    # Forward neighbors, sorted by vertex id for the intersections
+    forward = [np.array(sorted(u for u in adjacency[v] if rank[u] > rank[v]), dtype=np.int64)
+               for v in range(n)]
+
+    counts = np.zeros(n, dtype=np.int64)
+    total = 0
+    for v in range(n):
+        for u in forward[v]:
+            common = np.intersect1d(forward[v], forward[u], assume_unique=True)
+            if common.size:
+                total += common.size
+                counts[v] += common.size
+                counts[u] += common.size
+                np.add.at(counts, common, 1)
+
+    return total, dict(zip(nodes, counts.tolist()))
+
+
+def bfs_levels(adjacency, source):
+    """
+    Hop distances and BFS parents from source
+
+    Returns:
+        tuple: (dist, parent, order) where dist is -1 for unreached vertices
+            and order lists the reached vertices by distance
+    """
+    n = len(adjacency)
+    dist = [-1] * n
+    parent = [-1] * n
+    dist[source] = 0
+    order = [source]
+    for v in order:
+        for w in adjacency[v]:
+            if dist[w] < 0:
+                dist[w] = dist[v] + 1
+                parent[w] = v
+                order.append(w)
+    return dist, parent, order
+
+
+def components_by_root(adjacency):
+    """Vertex lists of the connected components, with an array union-find"""
+    n = len(adjacency)
+    parent = list(range(n))
+    for u in range(n):
+        for v in adjacency[u]:
+            root_u = find_root(parent, u)
+            root_v = find_root(parent, v)
+            if root_u != root_v:
+                parent[root_u] = root_v
+    members = {}
+    for v in range(n):
+        members.setdefault(find_root(parent, v), []).append(v)
+    return list(members.values())
+
+
+def bound_eccentricities(adjacency, members, lower, upper, diameter_only):
+    """
+    Takes-Kosters bounding of the eccentricities of one connected component
+
+    Every BFS from v tightens the bounds of all vertices w of the component:
+    max(ecc(v) - d(v, w), d(v, w)) <= ecc(w) <= ecc(v) + d(v, w). Vertices
+    whose bounds meet are settled without their own BFS. The first source is
+    the highest degree vertex, then the next source alternates between the
+    largest upper bound and the smallest lower bound. For the diameter only,
+    vertices that can neither raise the lower bound nor help lower the upper
+    one are dropped, and the search stops once both bounds meet.
+
+    Returns:
+        int: number of BFS runs
+    """
+    candidates = set(members)
+    runs = 0
+    v = max(members, key=lambda w: len(adjacency[w]))
+    pick_upper = True
+
+    while True:
+        dist, _, order = bfs_levels(adjacency, v)
+        runs += 1
+        eccentricity = dist[order[-1]]
+        lower[v] = upper[v] = eccentricity
+        candidates.discard(v)
+        for w in order:
+            d = dist[w]
+            lower[w] = max(lower[w], eccentricity - d, d)
+            upper[w] = min(upper[w], eccentricity + d)
+            if lower[w] == upper[w]:
+                candidates.discard(w)
+
+        if diameter_only:
+            best_lower = max(lower[w] for w in members)
+            best_upper = max(upper[w] for w in members)
+            if best_lower == best_upper:
+                break
+            candidates = {w for w in candidates
+                          if upper[w] > best_lower or 2 * lower[w] < best_upper}
+        if not candidates:
+            break
+
+        if pick_upper:
+            v = max(candidates, key=lambda w: (upper[w], len(adjacency[w])))
+        else:
+            v = min(candidates, key=lambda w: (lower[w], -len(adjacency[w])))
+        pick_upper = not pick_upper
+
+    return runs
+
+
+def run_bounding(graph, diameter_only):
+    """Bounds of every vertex, component by component; isolated vertices need no BFS"""
+    nodes, adjacency = index_graph(graph)
+    n = len(nodes)
+    lower = [0] * n
+    upper = [0 if not adjacency[v] else float('inf') for v in range(n)]
+    runs = 0
+    for members in components_by_root(adjacency):
+        if len(members) > 1:
+            runs += bound_eccentricities(adjacency, members, lower, upper, diameter_only)
+    return nodes, lower, runs
+
+
+def diameter(graph):
+    """
+    Exact diameter with Takes-Kosters bound pruning
+
+    The graph is treated as undirected; for a disconnected graph the largest
+    component diameter is returned. On real-world graphs only a handful of
+    BFS runs are usually needed, instead of one per node.
+
+    Returns:
+        tuple: (diameter, bfs_runs)
+    """
+    _, lower, runs = run_bounding(graph, diameter_only=True)
+    return max(lower, default=0), runs
+
+
+def eccentricities(graph):
+    """
+    All eccentricities with Takes-Kosters bound pruning
+
+    Returns:
+        tuple: ({node: eccentricity within its component}, bfs_runs)
+    """
+    nodes, lower, runs = run_bounding(graph, diameter_only=False)
+    return dict(zip(nodes, lower)), runs
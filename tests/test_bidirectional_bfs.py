@@ -0,0 +1,26 @@
+import random
+
+from algorithms.graph_algos import bfs, bidirectional_bfs
+
+
+def test_directed_graph_is_not_searched_backwards():
+    graph = {'s': ['a', 'b'], 'a': [], 'b': [], 't': ['a']}
+    assert 't' not in bfs(graph, 's')
+    assert bidirectional_bfs(graph, 's', 't')[:2] == (float('inf'), [])
+
+
+def test_reachability_matches_bfs_on_directed_graphs():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(2, 15)
+        graph = {u: [] for u in range(n)}
+        for _ in range(rng.randint(0, 2 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v and v not in graph[u]:
+                graph[u].append(v)
+        reached = set(bfs(graph, 0))
+        for target in range(1, n):
+            hops, path, _ = bidirectional_bfs(graph, 0, target)
+            assert (hops != float('inf')) == (target in reached)
+            if path:
+                assert all(v in graph[u] for u, v in zip(path, path[1:]))
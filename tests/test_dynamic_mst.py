@@ -0,0 +1,34 @@
+import random
+
+from algorithms.geometry_algos import delaunay_graph
+from algorithms.mst_algos import DynamicMST
+
+
+def tree_weight(tree):
+    return sum(weight for neighbors in tree.values() for weight in neighbors.values()) / 2
+
+
+def test_update_with_replaced_graph_matches_fresh_build():
+    rng = random.Random(0)
+    first = delaunay_graph([(rng.random(), rng.random()) for _ in range(300)])
+    second = delaunay_graph([(rng.random(), rng.random()) for _ in range(400)])
+    solver = DynamicMST(first)
+    tree = solver.update(second)
+    fresh = DynamicMST(second).spanning_tree()
+    assert tree.keys() == fresh.keys()
+    assert abs(tree_weight(tree) - tree_weight(fresh)) < 1e-9
+
+
+def test_small_edits_match_fresh_build():
+    rng = random.Random(1)
+    graph = {u: {} for u in range(60)}
+    for _ in range(200):
+        u, v = rng.randrange(60), rng.randrange(60)
+        if u != v:
+            graph[u][v] = graph[v][u] = rng.randint(1, 20)
+    solver = DynamicMST(graph)
+    for _ in range(20):
+        u = rng.choice([u for u in graph if graph[u]])
+        v = rng.choice(list(graph[u]))
+        graph[u][v] = graph[v][u] = rng.randint(1, 20)
+        assert tree_weight(solver.update(graph)) == tree_weight(DynamicMST(graph).spanning_tree())
@@ -0,0 +1,25 @@
+import random
+
+from algorithms.graph_algos import ford_fulkerson
+
+
+def test_prune_keeps_sink_without_out_edges():
+    graph = {'s': {'a': 5, 'b': 3}, 'a': {'t': 4}, 'b': {'t': 2}}
+    assert ford_fulkerson(graph, 's', 't', prune=True)[0] == 6
+    assert ford_fulkerson(graph, 's', 't')[0] == 6
+
+
+def test_prune_matches_unpruned_flow():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(2, 12)
+        graph = {u: {} for u in range(n)}
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                graph[u][v] = rng.randint(1, 9)
+        # Drop the sink's key half of the time, as in most hand-written networks
+        sink = n - 1
+        if rng.random() < 0.5:
+            del graph[sink]
+        assert ford_fulkerson(graph, 0, sink, prune=True)[0] == ford_fulkerson(graph, 0, sink)[0]
@@ -0,0 +1,20 @@
+import random
+
+from algorithms.graph_algos import dijkstra
+
+
+def test_dijkstra_prune_matches_unpruned():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(1, 12)
+        graph = {u: {} for u in range(n)}
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v:
+                graph[u][v] = rng.randint(1, 9)
+        distances, previous_nodes = dijkstra(graph, 0, prune=True)
+        assert distances == dijkstra(graph, 0)[0]
+        # Predecessors may differ on ties, but must lie on a shortest path
+        for v, u in previous_nodes.items():
+            if u is not None:
+                assert distances[u] + graph[u][v] == distances[v]
@@ -7,10 +7,12 @@ import networkx as nx
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTextEdit, QLabel, QMessageBox, QTabWidget,
-    QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog, QScrollArea
+    QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog, QScrollArea,
+    QComboBox
 )
 from PyQt6.QtCore import Qt
-from algorithms.graph_algos import coloration_glouton
+from algorithms.coloring_algos import greedy_coloring
+from algorithms.clique_algos import maximum_clique
 
 class ColoringPage(QWidget):
     def __init__(self, stack):
@@ -99,6 +101,19 @@ class ColoringPage(QWidget):
         self.tabs.addTab(table_tab, "Table Input")
         main_layout.addWidget(self.tabs)
 
+        # Vertex ordering selection
+        ordering_layout = QHBoxLayout()
+        ordering_layout.addWidget(QLabel("Vertex Ordering:"))
+        self.combo_ordering = QComboBox()
+        self.combo_ordering.addItem("Natural", "natural")
+        self.combo_ordering.addItem("Largest First", "largest_first")
+        self.combo_ordering.addItem("Smallest Last", "smallest_last")
+        self.combo_ordering.addItem("Incidence Degree", "incidence_degree")
+        self.combo_ordering.addItem("DSatur (Saturation Degree)", "dsatur")
+        ordering_layout.addWidget(self.combo_ordering)
+        ordering_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
+        main_layout.addLayout(ordering_layout)
+
         # Run button
         self.button_run_coloring = QPushButton("Run Greedy Coloring")
         self.button_run_coloring.clicked.connect(self.run_coloring)
@@ -151,7 +166,7 @@ class ColoringPage(QWidget):
             #importButton:hover {
                 background-color: #EBCB8B;
             }
-            QTextEdit, QTableWidget {
+            QTextEdit, QTableWidget, QComboBox {
                 background-color: #3B4252;
                 color: #ECEFF4;
                 border: 1px solid #4C566A;
@@ -293,9 +308,19 @@ class ColoringPage(QWidget):
             if self.animation and self.animation.event_source:
                 self.animation.event_source.stop()
             
-            # Run coloring and get the result
-            coloriage = coloration_glouton(graphe)
+            # Run coloring and get the result. Unlike coloration_glouton(),
+            # an edge listed on one side only constrains both nodes
+            coloriage = greedy_coloring(graphe, self.combo_ordering.currentData())
             result_text = "Coloring Result:\n"
+
+            # Any clique needs as many colors as it has nodes
+            clique = maximum_clique(graphe, time_limit=1.0)
+            colors_used = max(coloriage.values())
+            result_text += f"Colors used: {colors_used} vs clique lower bound: {len(clique)}"
+            result_text += f" (clique: {', '.join(map(str, clique))})\n"
+            if colors_used == len(clique):
+                result_text += "The coloring is optimal.\n"
+            result_text += "\n"
             for node, color in coloriage.items():
                 result_text += f"Node {node}: Color {color}\n"
             self.label_result.setText(result_text)
@@ -11,6 +11,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from algorithms.graph_algos import dfs
+from algorithms.connectivity_algos import biconnectivity
+from algorithms.summary_algos import core_numbers, triangle_count
 
 class DFSPage(QWidget):
     def __init__(self, stack):
@@ -109,11 +111,23 @@ class DFSPage(QWidget):
         node_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
         main_layout.addLayout(node_layout)
 
-        # Run button
+        # Control buttons
+        control_layout = QHBoxLayout()
         self.button_run_dfs = QPushButton("Run DFS Algorithm")
         self.button_run_dfs.clicked.connect(self.run_dfs)
         self.button_run_dfs.setObjectName("runButton")
-        main_layout.addWidget(self.button_run_dfs)
+        control_layout.addWidget(self.button_run_dfs)
+
+        self.button_cut_structure = QPushButton("Cut Vertices and Bridges")
+        self.button_cut_structure.clicked.connect(self.show_cut_structure)
+        self.button_cut_structure.setObjectName("controlButton")
+        control_layout.addWidget(self.button_cut_structure)
+
+        self.button_core_numbers = QPushButton("Color by Core Number")
+        self.button_core_numbers.clicked.connect(self.show_core_numbers)
+        self.button_core_numbers.setObjectName("controlButton")
+        control_layout.addWidget(self.button_core_numbers)
+        main_layout.addLayout(control_layout)
 
         # Result display with scroll area
         scroll_area = QScrollArea()
@@ -207,6 +221,15 @@ class DFSPage(QWidget):
                 border-radius: 8px;
                 min-height: 60px;
             }
+            #controlButton {
+                background-color: #5E81AC;
+                color: white;
+                border-radius: 5px;
+                padding: 5px;
+            }
+            #controlButton:hover {
+                background-color: #81A1C1;
+            }
         """)
 
     # ...rest of the code remains unchanged...
@@ -330,6 +353,106 @@ class DFSPage(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Input error: {str(e)}")
 
+    def show_cut_structure(self):
+        """Highlight articulation points and bridges of the graph"""
+        try:
+            # Get graph from current tab
+            if self.tabs.currentIndex() == 0:  # Dictionary tab
+                graphe = ast.literal_eval(self.entry_graphe.toPlainText().strip())
+            else:  # Table tab
+                graphe = self.get_graph_from_table()
+
+            if not graphe:
+                QMessageBox.warning(self, "Error", "Graph cannot be empty!")
+                return
+
+            result = biconnectivity(graphe)
+            cut_nodes = set(result['articulation_points'])
+            bridges = {frozenset(edge) for edge in result['bridges']}
+            bridge_text = ', '.join(f"{u}-{v}" for u, v in result['bridges'])
+            self.label_result.setText(
+                f"Articulation Points: {', '.join(map(str, result['articulation_points'])) or 'none'}\n"
+                f"Bridges: {bridge_text or 'none'}\n"
+                f"Biconnected Components: {len(result['biconnected_components'])}"
+            )
+
+            # Close previous visualization if exists
+            if self.current_figure:
+                plt.close(self.current_figure)
+            if self.animation and self.animation.event_source:
+                self.animation.event_source.stop()
+            self.animation = None
+
+            G = nx.Graph()
+            for node, neighbors in graphe.items():
+                G.add_node(node)
+                for neighbor in neighbors:
+                    G.add_edge(node, neighbor)
+            self.pos = nx.spring_layout(G)
+            fig, ax = plt.subplots(figsize=(10, 8))
+            self.current_figure = fig
+
+            node_colors = ['orange' if node in cut_nodes else 'lightblue' for node in G.nodes()]
+            edge_colors = ['red' if frozenset(edge) in bridges else 'gray' for edge in G.edges()]
+            edge_widths = [4 if frozenset(edge) in bridges else 2 for edge in G.edges()]
+            nx.draw(G, self.pos, ax=ax, with_labels=True,
+                    node_color=node_colors, edge_color=edge_colors,
+                    width=edge_widths, node_size=800, font_size=12, font_weight='bold')
+            ax.set_title("Articulation Points (orange) and Bridges (red)")
+            plt.show(block=False)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Input error: {str(e)}")
+
+    def show_core_numbers(self):
+        """Color the nodes by core number and report the triangle count"""
+        try:
+            # Get graph from current tab
+            if self.tabs.currentIndex() == 0:  # Dictionary tab
+                graphe = ast.literal_eval(self.entry_graphe.toPlainText().strip())
+            else:  # Table tab
+                graphe = self.get_graph_from_table()
+
+            if not graphe:
+                QMessageBox.warning(self, "Error", "Graph cannot be empty!")
+                return
+
+            cores = core_numbers(graphe)
+            total_triangles, _ = triangle_count(graphe)
+            max_core = max(cores.values())
+            result_text = f"Degeneracy (max core): {max_core}\nTriangles: {total_triangles}\n\n"
+            for node, core in cores.items():
+                result_text += f"Node {node}: Core {core}\n"
+            self.label_result.setText(result_text)
+
+            # Close previous visualization if exists
+            if self.current_figure:
+                plt.close(self.current_figure)
+            if self.animation and self.animation.event_source:
+                self.animation.event_source.stop()
+            self.animation = None
+
+            G = nx.Graph()
+            for node, neighbors in graphe.items():
+                G.add_node(node)
+                for neighbor in neighbors:
+                    G.add_edge(node, neighbor)
+            self.pos = nx.spring_layout(G)
+            fig, ax = plt.subplots(figsize=(10, 8))
+            self.current_figure = fig
+
+            cmap = plt.cm.get_cmap('viridis', max_core + 1)
+            node_colors = [cmap(cores[node]) for node in G.nodes()]
+            node_labels = {node: f"{node}\n(k={cores[node]})" for node in G.nodes()}
+            nx.draw(G, self.pos, ax=ax, with_labels=True, labels=node_labels,
+                    node_color=node_colors, edge_color='gray',
+                    width=2, node_size=800, font_size=10, font_weight='bold')
+            ax.set_title(f"Core Numbers (max core {max_core}, {total_triangles} triangles)")
+            plt.show(block=False)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Input error: {str(e)}")
+
     def dfs_static_plot(self, graph, start_node):
         """Show static DFS result with draggable nodes for large graphs"""
         G = nx.Graph()
@@ -5,10 +5,13 @@ import networkx as nx
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTextEdit, QLineEdit, QLabel, QMessageBox, QTabWidget,
-    QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog
+    QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog, QSpinBox
 )
 from PyQt6.QtCore import Qt
 from algorithms.graph_algos import dijkstra
+from algorithms.path_algos import k_shortest_paths
+
+PATH_COLORS = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'magenta', 'olive', 'cyan', 'pink']
 
 class DijkstraPage(QWidget):
     def __init__(self, stack):
@@ -99,6 +102,11 @@ class DijkstraPage(QWidget):
         node_layout.addWidget(QLabel("End Node:"))
         self.entry_end = QLineEdit("H")
         node_layout.addWidget(self.entry_end)
+        node_layout.addWidget(QLabel("Paths (k):"))
+        self.spin_paths = QSpinBox()
+        self.spin_paths.setRange(1, len(PATH_COLORS))
+        self.spin_paths.setValue(1)
+        node_layout.addWidget(self.spin_paths)
         main_layout.addLayout(node_layout)
 
         # Run button
@@ -224,6 +232,21 @@ class DijkstraPage(QWidget):
             if self.animation and self.animation.event_source:
                 self.animation.event_source.stop()
 
+            # Several alternatives: Yen's k shortest paths, drawn statically
+            k = self.spin_paths.value()
+            if k > 1:
+                paths = k_shortest_paths(graph, start, end, k)
+                if not paths:
+                    self.result_display.setPlainText(f"No path exists from {start} to {end}!")
+                    return
+                result_text = f"{len(paths)} shortest paths from {start} to {end}:\n"
+                for rank, (cost, path) in enumerate(paths, 1):
+                    result_text += f"{rank}. " + " → ".join(path) + f"  (distance: {cost})\n"
+                self.result_display.setPlainText(result_text)
+                self.current_figure = self.k_paths_plot(graph, start, end, paths)
+                self.animation = None
+                return
+
             # Run Dijkstra's algorithm
             distances, previous_nodes = dijkstra(graph, start)
 
@@ -333,6 +356,65 @@ class DijkstraPage(QWidget):
         plt.show(block=False)
         return fig
 
+    def k_paths_plot(self, graph, start, end, paths):
+        G = nx.Graph()
+        for node, neighbors in graph.items():
+            for neighbor, weight in neighbors.items():
+                G.add_edge(node, neighbor, weight=weight)
+        self.pos = nx.spring_layout(G)
+        self.G = G
+        fig, ax = plt.subplots(figsize=(10, 8))
+        self.current_figure = fig
+        on_path = {node for _, path in paths for node in path}
+        edge_labels = {(u, v): str(d['weight']) for u, v, d in G.edges(data=True)}
+
+        def draw():
+            ax.clear()
+            node_colors = ['lightblue' if node in on_path else 'lightgray' for node in G.nodes()]
+            nx.draw_networkx_nodes(G, self.pos, ax=ax, node_color=node_colors, node_size=800)
+            nx.draw_networkx_labels(G, self.pos, ax=ax, font_size=10)
+            nx.draw_networkx_edges(G, self.pos, ax=ax, edge_color='gray', width=1)
+            # Later paths are drawn thinner on top, so shared edges show every color
+            for rank, (cost, path) in enumerate(paths):
+                nx.draw_networkx_edges(G, self.pos, ax=ax, edgelist=list(zip(path[:-1], path[1:])),
+                                       edge_color=PATH_COLORS[rank], width=2 + 2 * (len(paths) - rank),
+                                       alpha=0.7, label=f"#{rank + 1}: {cost}")
+            nx.draw_networkx_edge_labels(G, self.pos, ax=ax, edge_labels=edge_labels)
+            ax.legend(loc='upper left')
+            ax.set_title(f"{len(paths)} shortest paths from {start} to {end}")
+            ax.axis('off')
+
+        draw()
+
+        # Mouse event handlers for dragging nodes
+        def on_press(event):
+            if event.inaxes != ax:
+                return
+            for node in G.nodes():
+                x, y = self.pos[node]
+                if (x - event.xdata) ** 2 + (y - event.ydata) ** 2 < 0.01:
+                    self.selected_node = node
+                    self.offset = (x - event.xdata, y - event.ydata)
+                    break
+
+        def on_motion(event):
+            if not hasattr(self, 'selected_node') or self.selected_node is None or event.inaxes != ax:
+                return
+            self.pos[self.selected_node] = (event.xdata + self.offset[0], event.ydata + self.offset[1])
+            draw()
+            fig.canvas.draw_idle()
+
+        def on_release(event):
+            if hasattr(self, 'selected_node'):
+                self.selected_node = None
+
+        fig.canvas.mpl_connect('button_press_event', on_press)
+        fig.canvas.mpl_connect('motion_notify_event', on_motion)
+        fig.canvas.mpl_connect('button_release_event', on_release)
+
+        plt.show(block=False)
+        return fig
+
     def dijkstra_visualizer(self, graph, start, end, distances, previous_nodes):
         import heapq
         G = nx.Graph()
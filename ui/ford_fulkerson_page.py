@@ -9,13 +9,14 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog
 )
 from PyQt6.QtCore import Qt
-from algorithms.graph_algos import ford_fulkerson
+from algorithms.flow_algos import IncrementalMaxFlow
 
 class FordFulkersonPage(QWidget):
     def __init__(self, stack):
         super().__init__()
         self.stack = stack
         self.graph = {}
+        self.max_flow_solver = None
         self.current_figure = None
         self.paused = False
         self.current_frame = 0
@@ -321,8 +322,16 @@ class FordFulkersonPage(QWidget):
                 QMessageBox.warning(self, "Error", "Source or sink node not in flow network!")
                 return
 
-            # Run Ford-Fulkerson algorithm
-            max_flow, flow_network = ford_fulkerson(graph, source, sink)
+            # Run Ford-Fulkerson algorithm, re-solving from the previous flow
+            # when only capacities changed since the last run
+            solver = self.max_flow_solver
+            if solver is not None and solver.source == source and solver.sink == sink:
+                max_flow = solver.update(graph)
+            else:
+                solver = IncrementalMaxFlow(graph, source, sink)
+                self.max_flow_solver = solver
+                max_flow = solver.max_flow
+            flow_network = solver.flow_network()
             
             # Format results
             result_text = f"Maximum Flow from {source} to {sink}: {max_flow}\n\n"
@@ -351,6 +360,7 @@ class FordFulkersonPage(QWidget):
             QMessageBox.critical(self, "Error", f"Input error: {str(e)}")
             self.result_display.setPlainText(f"Error: {str(e)}")
             self.cleanup_visualization()
+            self.max_flow_solver = None
 
     def draw_ff_result_plot(self, graph, source, sink, max_flow, flow_network):
         """Draw only the final result plot (no animation) and allow node dragging."""
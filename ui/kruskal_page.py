@@ -3,20 +3,27 @@ import matplotlib
 matplotlib.use('Qt5Agg')
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
 import networkx as nx
+import numpy as np
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QTextEdit, QLineEdit, QLabel, QMessageBox, QTabWidget,
     QTableWidget, QTableWidgetItem, QSpacerItem, QSizePolicy, QFileDialog
 )
 from PyQt6.QtCore import Qt
-from algorithms.graph_algos import kruskal
+from algorithms.mst_algos import DynamicMST
+from algorithms.geometry_algos import delaunay_graph
 
 class KruskalPage(QWidget):
     def __init__(self, stack):
         super().__init__()
         self.stack = stack
         self.graph = {}
+        self.point_graph = None
+        self.point_text = None
+        self.point_pos = {}
+        self.mst_solver = None
         self.current_figure = None
         self.animation = None
         self.paused = False
@@ -51,6 +58,10 @@ class KruskalPage(QWidget):
         self.btn_import.clicked.connect(self.import_from_file)
         self.btn_import.setObjectName("importButton")
         import_layout.addWidget(self.btn_import)
+        self.btn_import_points = QPushButton("Import Points from File")
+        self.btn_import_points.clicked.connect(self.import_points)
+        self.btn_import_points.setObjectName("importButton")
+        import_layout.addWidget(self.btn_import_points)
         import_layout.addWidget(QLabel("OR enter manually below:"))
         import_layout.addSpacerItem(QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
         main_layout.addLayout(import_layout)
@@ -294,6 +305,67 @@ class KruskalPage(QWidget):
                 f"Failed to import file:\n\n{str(e)}"
             )
 
+    def import_points(self):
+        """Import coordinates (one point per line) as their Delaunay graph, which contains the Euclidean MST"""
+        try:
+            file_name, _ = QFileDialog.getOpenFileName(
+                self,
+                "Import Points",
+                "",
+                "Text Files (*.txt *.csv);;All Files (*)"
+            )
+            
+            if not file_name:
+                return
+                
+            try:
+                points = np.loadtxt(file_name, delimiter=',' if file_name.endswith('.csv') else None, ndmin=2)
+                labels = [str(i) for i in range(len(points))]
+                self.point_graph = delaunay_graph(points, labels=labels)
+                # A new point set shares nothing with the previous graph
+                self.mst_solver = None
+
+                # Nodes are drawn at their coordinates; 1-D points sit on a line
+                xy = points[:, :2] if points.shape[1] > 1 else np.column_stack((points[:, 0], np.zeros(len(points))))
+                self.point_pos = dict(zip(labels, map(tuple, xy.tolist())))
+
+                # The repr of a large point graph is huge, so the dictionary tab
+                # only names it; the graph is used until this text is edited
+                self.point_text = f"# Delaunay graph of the {len(points)} imported points"
+                self.entry_graph.setPlainText(self.point_text)
+                self.tabs.setCurrentIndex(0)  # Switch to dictionary tab
+                
+                QMessageBox.information(
+                    self,
+                    "Import Successful",
+                    f"{len(points)} points imported as their Delaunay graph!"
+                )
+            except Exception as e:
+                QMessageBox.warning(
+                    self,
+                    "Import Error",
+                    f"Invalid point coordinates:\n\n{str(e)}"
+                )
+                
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Import Error",
+                f"Failed to import file:\n\n{str(e)}"
+            )
+
+    def get_graph_from_dict(self):
+        text = self.entry_graph.toPlainText().strip()
+        if self.point_graph is not None and text == self.point_text:
+            return self.point_graph
+        return ast.literal_eval(text)
+
+    def layout(self, G, graph):
+        """Imported point coordinates for the point graph, else a spring layout"""
+        if graph is self.point_graph:
+            return {node: self.point_pos[node] for node in G}
+        return nx.spring_layout(G)
+
     def get_graph_from_table(self):
         graph = {}
         for row in range(self.table.rowCount()):
@@ -322,7 +394,7 @@ class KruskalPage(QWidget):
         try:
             # Get graph from current tab
             if self.tabs.currentIndex() == 0:  # Dictionary tab
-                graph = ast.literal_eval(self.entry_graph.toPlainText().strip())
+                graph = self.get_graph_from_dict()
             else:  # Table tab
                 graph = self.get_graph_from_table()
             
@@ -342,11 +414,16 @@ class KruskalPage(QWidget):
             self.btn_pause.setEnabled(True)
             self.btn_reset.setEnabled(True)
 
-            # Run Kruskal's algorithm
-            mst = kruskal(graph)
+            # Run Kruskal's algorithm, updating the previous tree edge by
+            # edge when the graph was only edited since the last run
+            if self.mst_solver is None:
+                self.mst_solver = DynamicMST(graph)
+                mst = self.mst_solver.spanning_tree()
+            else:
+                mst = self.mst_solver.update(graph)
             
             # Calculate total weight
-            total_weight = sum(weight for neighbors in mst.values() for weight in neighbors.values()) // 2
+            total_weight = sum(weight for neighbors in mst.values() for weight in neighbors.values()) / 2
             
             # Format results with aligned columns
             result_text = "Minimum Spanning Tree Edges (Kruskal's):\n"
@@ -371,12 +448,31 @@ class KruskalPage(QWidget):
                 self.current_figure, self.animation = self.kruskal_visualizer(graph, mst)
             else:
                 self.btn_pause.setEnabled(False)
-                self.current_figure = self.kruskal_static_plot(graph, mst)
+                if graph is self.point_graph:
+                    self.current_figure = self.point_static_plot(graph, mst)
+                else:
+                    self.current_figure = self.kruskal_static_plot(graph, mst)
                 self.animation = None
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Input error: {str(e)}")
             self.result_display.setPlainText(f"Error: {str(e)}")
+            self.mst_solver = None
+
+    def point_static_plot(self, graph, mst):
+        """Draw an imported point graph in bulk: small markers and the tree edges, no labels"""
+        fig, ax = plt.subplots(figsize=(10, 8))
+        self.current_figure = fig
+        xy = np.array([self.point_pos[node] for node in graph])
+        tree_edges = [(self.point_pos[u], self.point_pos[v]) for u in mst for v in mst[u] if u < v]
+        ax.add_collection(LineCollection(tree_edges, colors='blue', linewidths=1))
+        ax.scatter(xy[:, 0], xy[:, 1], s=4, c='black', zorder=3)
+        ax.set_aspect('equal')
+        ax.autoscale_view()
+        ax.set_title("Minimum Spanning Tree (static view)")
+        ax.axis('off')
+        plt.show(block=False)
+        return fig
 
     def kruskal_static_plot(self, graph, mst):
         """Show static MST result with draggable nodes for large graphs"""
@@ -384,7 +480,7 @@ class KruskalPage(QWidget):
         for node, neighbors in graph.items():
             for neighbor, weight in neighbors.items():
                 G.add_edge(node, neighbor, weight=weight)
-        self.pos = nx.spring_layout(G)
+        self.pos = self.layout(G, graph)
         self.G = G
         fig, ax = plt.subplots(figsize=(10, 8))
         self.current_figure = fig
@@ -467,17 +563,20 @@ class KruskalPage(QWidget):
                 self.btn_pause.setText("Pause")
 
     def reset_layout(self):
-        """Reset graph layout to default spring layout"""
+        """Reset graph layout to the default layout"""
         if hasattr(self, 'pos') and self.current_figure:
             G = nx.Graph()
             if self.tabs.currentIndex() == 0:  # Dictionary tab
-                graph = ast.literal_eval(self.entry_graph.toPlainText().strip())
+                graph = self.get_graph_from_dict()
             else:  # Table tab
                 graph = self.get_graph_from_table()
+            if graph is self.point_graph and len(graph) >= 15:
+                # Imported points are drawn at fixed coordinates
+                return
             for node, neighbors in graph.items():
                 for neighbor in neighbors:
                     G.add_edge(node, neighbor)
-            self.pos = nx.spring_layout(G)
+            self.pos = self.layout(G, graph)
             if hasattr(self, 'update'):
                 self.update(self.current_frame)
                 self.current_figure.canvas.draw_idle()
@@ -503,7 +602,7 @@ class KruskalPage(QWidget):
             for neighbor, weight in neighbors.items():
                 G.add_edge(node, neighbor, weight=weight)
         
-        self.pos = nx.spring_layout(G)
+        self.pos = self.layout(G, graph)
         self.G = G
         self.current_frame = 0
         
@@ -12,6 +12,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from algorithms.graph_algos import welsh_powell
+from algorithms.clique_algos import maximum_clique
 
 class WelshPowellPage(QWidget):
     def __init__(self, stack):
@@ -297,6 +298,24 @@ class WelshPowellPage(QWidget):
             # Run coloring and get the result
             coloriage = welsh_powell(graphe)
             result_text = "Coloring Result:\n"
+
+            # Any clique needs as many colors as it has nodes
+            clique = maximum_clique(graphe, time_limit=1.0)
+            colors_used = max(coloriage.values())
+            result_text += f"Colors used: {colors_used} vs clique lower bound: {len(clique)}"
+            result_text += f" (clique: {', '.join(map(str, clique))})\n"
+            # The clique search treats edges as undirected, while welsh_powell()
+            # reads the lists as given, so only a coloring that is proper in
+            # both directions can be compared with the clique
+            clashes = [(u, v) for u, neighbors in graphe.items() for v in neighbors
+                       if u != v and coloriage.get(v) == coloriage[u]]
+            if clashes:
+                u, v = clashes[0]
+                result_text += (f"Nodes {u} and {v} share a color: an edge listed on one side "
+                                "only is not checked by Welsh-Powell.\n")
+            elif colors_used == len(clique):
+                result_text += "The coloring is optimal.\n"
+            result_text += "\n"
             for node, color in coloriage.items():
                 result_text += f"Node {node}: Color {color}\n"
             self.label_result.setText(result_text)